@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Import time of the location providers
+Compares importing every provider module (as sensor.py did before the providers were
+loaded on demand) with importing only the provider of one configured gemeente.
+Every sample runs in a fresh interpreter, so nothing is cached in sys.modules.
+Usage: python3 benchmarks/import_time.py [--runs 15] [--gemeente sliedrecht] [--json result.json]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SAMPLE = """
+import sys, time
+# aiohttp is always loaded by Home Assistant itself
+import aiohttp
+start = time.perf_counter()
+from custom_components.afvalinfo.location import registry
+for gemeente in {gemeenten!r}:
+    registry.get_provider(gemeente)
+elapsed = time.perf_counter() - start
+modules = [m for m in sys.modules if m.startswith("custom_components.afvalinfo.location.")]
+print(elapsed, len(modules) - 1)
+"""
+
+
+def measure(gemeenten, runs):
+    code = SAMPLE.format(gemeenten=gemeenten)
+    timings = []
+    modules = 0
+    for _ in range(runs):
+        output = subprocess.check_output([sys.executable, "-c", code], cwd=ROOT)
+        elapsed, modules = output.decode().split()
+        timings.append(float(elapsed) * 1000)
+    return {
+        "median_ms": round(statistics.median(timings), 2),
+        "min_ms": round(min(timings), 2),
+        "max_ms": round(max(timings), 2),
+        "provider_modules": int(modules),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=15)
+    parser.add_argument("--gemeente", default="sliedrecht")
+    parser.add_argument("--json", help="write the results to this file")
+    args = parser.parse_args()
+
+    sys.path.insert(0, ROOT)
+    from custom_components.afvalinfo.const.const import SENSOR_LOCATIONS_TO_GEMEENTEN
+
+    # one gemeente per location imports every provider module
+    every_location = [gemeenten[0] for gemeenten in SENSOR_LOCATIONS_TO_GEMEENTEN.values()]
+
+    result = {
+        "runs": args.runs,
+        "before_all_providers": measure(every_location, args.runs),
+        "after_configured_provider": measure([args.gemeente], args.runs),
+    }
+    result["speedup"] = round(
+        result["before_all_providers"]["median_ms"] / result["after_configured_provider"]["median_ms"], 2
+    )
+
+    print("Import time of the location providers ({0} runs, median)".format(args.runs))
+    print("  before, all providers:      {0[median_ms]:8.2f} ms, provider modules: {0[provider_modules]}".format(result["before_all_providers"]))
+    print("  after, only {0:<16} {1[median_ms]:8.2f} ms, provider modules: {1[provider_modules]}".format(args.gemeente + ":", result["after_configured_provider"]))
+    print("  speedup:                    {0:8.2f}x".format(result["speedup"]))
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(result, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Parse time and memory of the location providers
+Runs every fixture of benchmarks/replay.py with its responses already in memory, so the
+measured time is the parsing of the responses into a schedule. Reports the median and p95
+wall time per fixture, and of one run the tracemalloc peak, the memory blocks it allocated and
+the blocks it leaves behind. The allocated blocks are counted right after the run, while its
+client, responses and schedule are still alive. Temporaries the parse already freed are only in
+the peak. Timing runs and tracemalloc runs are separate, tracemalloc slows everything down.
+Usage: python3 benchmarks/parse_time.py [--runs 50] [--parser html.parser] [--json parse_time.json] [--compare old.json] [fixture ...]
+"""
+import argparse
+import asyncio
+import gc
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+import replay
+
+
+class MemoryReplayClient(replay.ReplayClient):
+    """A replay client which has read all the files of the fixture beforehand."""
+
+    def __init__(self, fixture, responses):
+        super().__init__(fixture, responses)
+        self._content = {}
+        for response in responses:
+            with open(os.path.join(replay.FIXTURES, fixture, response["file"]), "rb") as f:
+                self._content[response["file"]] = f.read()
+
+    async def request(self, method, url, **kwargs):
+        files = self._responses.get((method, url))
+        if not files:
+            raise replay.ReplayError("%s has no response for %s %s" % (self._fixture, method, url))
+        name = files.pop(0) if len(files) > 1 else files[0]
+        return self._content[name]
+
+
+def percentile(values, pct):
+    values = sorted(values)
+    index = min(len(values) - 1, max(0, int(round(pct / 100.0 * len(values) + 0.5)) - 1))
+    return values[index]
+
+
+def measure(fixture, runs):
+    manifest = replay.load_manifest(fixture)
+    provider, module = replay.load_provider(manifest["gemeente"])
+    loop = asyncio.new_event_loop()
+
+    def run_once(snapshot=False):
+        client = MemoryReplayClient(fixture, manifest["responses"])
+        coro = provider().async_get_data(
+            client, manifest["gemeente"], manifest["postcode"], manifest["street_number"], list(manifest["resources"])
+        )
+        start = time.perf_counter()
+        schedule = loop.run_until_complete(coro)
+        elapsed = time.perf_counter() - start
+        if snapshot:
+            # before the client and the schedule of the run are freed
+            return elapsed, tracemalloc.take_snapshot()
+        return elapsed, schedule
+
+    try:
+        with replay.pinned(module):
+            # warm up, the first run also fills the caches of bs4 and the regex module
+            _, schedule = run_once()
+
+            timings = []
+            for _ in range(runs):
+                elapsed, _ = run_once()
+                timings.append(elapsed * 1000)
+
+            gc.collect()
+            tracemalloc.start()
+            before = tracemalloc.take_snapshot()
+            tracemalloc.reset_peak()
+            _, during = run_once(snapshot=True)
+            _, peak = tracemalloc.get_traced_memory()
+            gc.collect()
+            after = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+    finally:
+        loop.close()
+
+    allocated = sum(max(stat.count_diff, 0) for stat in during.compare_to(before, "lineno"))
+    retained = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    size = sum(
+        os.path.getsize(os.path.join(replay.FIXTURES, fixture, response["file"]))
+        for response in manifest["responses"]
+    )
+    return {
+        "location": provider.__module__.rsplit(".", 1)[-1],
+        "response_kib": round(size / 1024.0, 1),
+        "median_ms": round(statistics.median(timings), 3),
+        "p95_ms": round(percentile(timings, 95), 3),
+        "min_ms": round(min(timings), 3),
+        "peak_kib": round(peak / 1024.0, 1),
+        "allocated_blocks": allocated,
+        "retained_blocks": retained,
+        "waste_types": len(schedule.waste_types) if schedule else 0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("fixtures", nargs="*", help="only measure these fixtures")
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--json", default="parse_time.json", help="write the results to this file")
+    parser.add_argument("--compare", help="show the change against the results in this file")
+    parser.add_argument("--parser", help="html parser for BeautifulSoup, lxml or html.parser")
+    args = parser.parse_args()
+
+    sys.path.insert(0, replay.ROOT)
+    logging.basicConfig(level=logging.CRITICAL)
+    html_parser = replay.use_parser(args.parser)
+    print("parser: %s" % html_parser)
+
+    previous = {}
+    if args.compare:
+        with open(args.compare) as f:
+            previous = json.load(f)["fixtures"]
+
+    results = {}
+    print("{0:<28} {1:>8} {2:>10} {3:>10} {4:>10} {5:>9} {6:>9}".format(
+        "fixture", "kib", "median ms", "p95 ms", "peak kib", "allocated", "retained"
+    ))
+    for fixture in args.fixtures or replay.fixture_names():
+        result = results[fixture] = measure(fixture, args.runs)
+        line = "{0:<28} {1[response_kib]:>8} {1[median_ms]:>10.3f} {1[p95_ms]:>10.3f} {1[peak_kib]:>10.1f} {1[allocated_blocks]:>9} {1[retained_blocks]:>9}".format(
+            fixture, result
+        )
+        if fixture in previous:
+            line += "   {0:>6.2f}x median, {1:>6.2f}x peak".format(
+                previous[fixture]["median_ms"] / result["median_ms"],
+                previous[fixture]["peak_kib"] / result["peak_kib"],
+            )
+        print(line)
+
+    with open(args.json, "w") as f:
+        json.dump({
+            "python": sys.version.split()[0],
+            "parser": html_parser,
+            "runs": args.runs,
+            "pinned_today": str(replay.PINNED_TODAY),
+            "fixtures": results,
+        }, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+if __name__ == "__main__":
+    main()
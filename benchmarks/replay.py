@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Replay recorded responses through the location providers
+Every directory in benchmarks/fixtures holds the responses of one location for one address,
+with a manifest.json that tells which gemeente, postcode, street number and resources to use
+and which file answers which request. The provider runs against these files with the clock
+pinned to PINNED_TODAY and its schedule is compared with benchmarks/golden/<fixture>.json.
+The fixtures are synthetic responses in the markup the parsers expect, not live recordings.
+Usage: python3 benchmarks/replay.py [--update] [--parser html.parser] [fixture ...]
+"""
+import argparse
+import asyncio
+from contextlib import asynccontextmanager, contextmanager
+import datetime as _datetime
+import difflib
+import json
+import logging
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES = os.path.join(ROOT, "benchmarks", "fixtures")
+GOLDEN = os.path.join(ROOT, "benchmarks", "golden")
+
+# A friday in november, so the parsers have to roll over into next year
+PINNED_TODAY = _datetime.date(2020, 11, 20)
+
+
+class ReplayError(Exception):
+    pass
+
+
+class ReplayClient(object):
+    """Answers the requests of a provider with the files of a fixture, like AfvalinfoClient."""
+
+    def __init__(self, fixture, responses):
+        self._fixture = fixture
+        self._responses = {}
+        for response in responses:
+            key = (response["method"], response["url"])
+            self._responses.setdefault(key, []).append(response["file"])
+        self.requests = []
+
+    async def request(self, method, url, **kwargs):
+        self.requests.append((method, url))
+        files = self._responses.get((method, url))
+        if not files:
+            raise ReplayError("%s has no response for %s %s" % (self._fixture, method, url))
+        # Responses for the same request are used in order, the last one is repeated
+        name = files.pop(0) if len(files) > 1 else files[0]
+        with open(os.path.join(FIXTURES, self._fixture, name), "rb") as f:
+            return f.read()
+
+    async def get_text(self, url, **kwargs):
+        return (await self.request("GET", url, **kwargs)).decode("utf-8")
+
+    async def get_json(self, url, **kwargs):
+        return json.loads(await self.request("GET", url, **kwargs))
+
+    async def post_text(self, url, **kwargs):
+        return (await self.request("POST", url, **kwargs)).decode("utf-8")
+
+    async def post_json(self, url, **kwargs):
+        return json.loads(await self.request("POST", url, **kwargs))
+
+    @asynccontextmanager
+    async def cookie_session(self, cookie_jar=None):
+        yield self
+
+
+def pinned_clock(today):
+    class PinnedDate(_datetime.date):
+        @classmethod
+        def today(cls):
+            return cls(today.year, today.month, today.day)
+
+    class PinnedDatetime(_datetime.datetime):
+        @classmethod
+        def today(cls):
+            return cls(today.year, today.month, today.day, 12)
+
+        @classmethod
+        def now(cls, tz=None):
+            return cls(today.year, today.month, today.day, 12, tzinfo=tz)
+
+    return {"date": PinnedDate, "datetime": PinnedDatetime}
+
+
+@contextmanager
+def pinned(module, today=PINNED_TODAY):
+    """Replace the date and datetime classes a provider module imported."""
+    originals = {}
+    for name, cls in pinned_clock(today).items():
+        if getattr(module, name, None) is getattr(_datetime, name):
+            originals[name] = getattr(module, name)
+            setattr(module, name, cls)
+    try:
+        yield
+    finally:
+        for name, cls in originals.items():
+            setattr(module, name, cls)
+
+
+def use_parser(parser):
+    """Make the providers use this BeautifulSoup parser instead of the one soup.py picked."""
+    from custom_components.afvalinfo import soup
+
+    if parser:
+        soup.HTML_PARSER = parser
+    return soup.HTML_PARSER
+
+
+def fixture_names():
+    return sorted(
+        name for name in os.listdir(FIXTURES)
+        if os.path.isfile(os.path.join(FIXTURES, name, "manifest.json"))
+    )
+
+
+def load_manifest(fixture):
+    with open(os.path.join(FIXTURES, fixture, "manifest.json")) as f:
+        return json.load(f)
+
+
+def load_provider(gemeente):
+    from custom_components.afvalinfo.location import registry
+
+    provider = registry.get_provider(gemeente)
+    return provider, sys.modules[provider.__module__]
+
+
+async def async_replay(fixture, manifest=None):
+    """Run the provider of a fixture, returns the schedule and the replay client."""
+    manifest = manifest or load_manifest(fixture)
+    provider, module = load_provider(manifest["gemeente"])
+    client = ReplayClient(fixture, manifest["responses"])
+    with pinned(module):
+        schedule = await provider().async_get_data(
+            client,
+            manifest["gemeente"],
+            manifest["postcode"],
+            manifest["street_number"],
+            list(manifest["resources"]),
+        )
+    return schedule, client
+
+
+def render(schedule):
+    """The golden text of a schedule, False when the provider failed."""
+    result = schedule.as_dict() if schedule else schedule
+    return json.dumps(result, indent=2, sort_keys=True) + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("fixtures", nargs="*", help="only replay these fixtures")
+    parser.add_argument("--update", action="store_true", help="write the golden files instead of comparing")
+    parser.add_argument("--verbose", action="store_true", help="show the log of the providers")
+    parser.add_argument("--parser", help="html parser for BeautifulSoup, lxml or html.parser")
+    args = parser.parse_args()
+
+    sys.path.insert(0, ROOT)
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.CRITICAL)
+    print("parser: %s" % use_parser(args.parser))
+
+    failed = []
+    for fixture in args.fixtures or fixture_names():
+        try:
+            schedule, _ = asyncio.run(async_replay(fixture))
+            output = render(schedule)
+        except ReplayError as exc:
+            print("ERROR   %s: %s" % (fixture, exc))
+            failed.append(fixture)
+            continue
+
+        golden = os.path.join(GOLDEN, fixture + ".json")
+        if args.update:
+            os.makedirs(GOLDEN, exist_ok=True)
+            with open(golden, "w", newline="\n") as f:
+                f.write(output)
+            print("updated %s" % fixture)
+            continue
+
+        expected = open(golden).read() if os.path.exists(golden) else ""
+        if output == expected:
+            print("ok      %s" % fixture)
+        else:
+            print("CHANGED %s" % fixture)
+            sys.stdout.writelines(difflib.unified_diff(
+                expected.splitlines(True), output.splitlines(True), "golden/" + fixture + ".json", "replay"
+            ))
+            failed.append(fixture)
+
+    if failed:
+        print("%d of %d fixtures failed" % (len(failed), len(args.fixtures or fixture_names())))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+from .const.const import (
+    STORAGE_KEY,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
+)
+from .schedule import CollectionSchedule
+
+from homeassistant.helpers.storage import Store
+import homeassistant.util.dt as dt_util
+
+
+class AfvalinfoCache(object):
+    """Collection schedules and address ids per (provider, postcode, street number), stored in the config dir."""
+
+    def __init__(self, hass):
+        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._data = None
+
+    @staticmethod
+    def key(provider, postcode, street_number):
+        return "{0}|{1}|{2}".format(provider, postcode.replace(" ", "").upper(), street_number)
+
+    async def async_load(self):
+        if self._data is None:
+            data = await self._store.async_load()
+            if self._data is None:
+                self._data = data or {}
+
+    def get(self, key, resources):
+        """Cached (schedule, fetched) for key, or None if resources were not all fetched."""
+        entry = (self._data or {}).get(key)
+        if not entry or "schedule" not in entry or not set(resources) <= set(entry["resources"]):
+            return None
+        return (
+            CollectionSchedule.from_waste_dict(entry["schedule"]),
+            dt_util.parse_datetime(entry["fetched"]),
+        )
+
+    def set(self, key, resources, schedule, fetched):
+        self._entry(key).update({
+            "fetched": fetched.isoformat(),
+            "resources": sorted(resources),
+            "schedule": schedule.as_dict(),
+        })
+        self._save()
+
+    def get_address(self, key):
+        """Cached (address, resolved) of the location for key, or None."""
+        entry = (self._data or {}).get(key)
+        if not entry or "address" not in entry:
+            return None
+        return entry["address"]["value"], dt_util.parse_datetime(entry["address"]["resolved"])
+
+    def set_address(self, key, address, resolved):
+        # address None forgets the address
+        if address is None:
+            self._entry(key).pop("address", None)
+        else:
+            self._entry(key)["address"] = {"value": address, "resolved": resolved.isoformat()}
+        self._save()
+
+    def _entry(self, key):
+        if self._data is None:
+            self._data = {}
+        return self._data.setdefault(key, {})
+
+    def _save(self):
+        # write all changes of one refresh at once
+        self._store.async_delay_save(lambda: self._data, STORAGE_SAVE_DELAY)
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+import json
+
+import aiohttp
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.util import ssl as ssl_util
+
+from .const.const import (
+    HTTP_KEEPALIVE_TIMEOUT,
+    HTTP_LIMIT_PER_HOST,
+    HTTP_TIMEOUT,
+)
+
+DEFAULT_HEADERS = {"Accept-Encoding": "gzip, deflate"}
+
+
+def async_create_client(hass):
+    """Create the client with the connection pool for all the location scrapers."""
+    # Connections are kept alive per host and share one SSL context, so the second
+    # request to a location doesn't need a new connection or TLS handshake
+    connector = aiohttp.TCPConnector(
+        limit_per_host=HTTP_LIMIT_PER_HOST,
+        keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+        ssl=ssl_util.client_context(),
+    )
+    session = aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=HTTP_TIMEOUT),
+        headers=DEFAULT_HEADERS,
+    )
+
+    async def async_close(event):
+        await session.close()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, async_close)
+    return AfvalinfoClient(session)
+
+
+class AfvalinfoClient(object):
+    """Async HTTP client shared by all the location scrapers."""
+
+    def __init__(self, session):
+        self._session = session
+
+    async def request(self, method, url, **kwargs):
+        async with self._session.request(method, url, **kwargs) as response:
+            response.raise_for_status()
+            return await response.read()
+
+    async def get_text(self, url, **kwargs):
+        return (await self.request("GET", url, **kwargs)).decode("utf-8")
+
+    async def get_json(self, url, **kwargs):
+        return json.loads(await self.request("GET", url, **kwargs))
+
+    async def post_text(self, url, **kwargs):
+        return (await self.request("POST", url, **kwargs)).decode("utf-8")
+
+    async def post_json(self, url, **kwargs):
+        return json.loads(await self.request("POST", url, **kwargs))
+
+    @property
+    def cookie_jar(self):
+        return self._session.cookie_jar
+
+    def cookie_session(self, cookie_jar=None):
+        # A client with its own cookie jar, for the locations that need a session cookie.
+        # It reuses the connection pool, timeout and headers of the shared session.
+        return CookieSession(self._session, cookie_jar)
+
+
+class CookieSession(object):
+    """The "async with" of AfvalinfoClient.cookie_session, closes the session again afterwards."""
+
+    def __init__(self, shared_session, cookie_jar):
+        self._shared_session = shared_session
+        self._cookie_jar = cookie_jar if cookie_jar is not None else aiohttp.CookieJar()
+        self._session = None
+
+    async def __aenter__(self):
+        self._session = aiohttp.ClientSession(
+            connector=self._shared_session.connector,
+            connector_owner=False,
+            cookie_jar=self._cookie_jar,
+            timeout=self._shared_session.timeout,
+            headers=DEFAULT_HEADERS,
+        )
+        return AfvalinfoClient(self._session)
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self._session.close()
@@ -1,6 +1,8 @@
 import logging
 from datetime import timedelta
 
+DOMAIN = "afvalinfo"
+
 SENSOR_TYPES = {
     "gft": ["GFT", "mdi:recycle"],
     "papier": ["Papier", "mdi:recycle"],
@@ -98,6 +100,92 @@ SENSOR_LOCATIONS_TO_COMPANY_CODE = {
     "waardlanden": ["942abcf6-3775-400d-ae5d-7380d728b23c"]
 }
 
+# Locations on the "adres/{postcode}:{number}" platform, the trash types link to "/afvalstroom/{id}"
+# trash type -> afvalstroom ids, when the first id has no date the next one is used
+SENSOR_LOCATIONS_TO_AFVALSTROOM = {
+    "alkmaar": {"gft": [4], "papier": [5], "pbd": [3]},
+    "alphenaandenrijn": {"gft": [112], "papier": [87], "pbd": [113], "restafval": [101]},
+    "berkelland": {"gft": [104], "pbd": [151, 102], "restafval": [95]},
+    "blink": {"pbd": [4], "gft": [78, 75], "papier": [1], "restafval": [81]},
+    "circulusberkel": {"restafval": [1], "gft": [55], "textiel": [6], "papier": [4], "pbd": [11]},
+    "cranendonck": {"papier": [7], "gft": [2], "pbd": [1], "restafval": [8]},
+    "cyclus": {"gft": [1], "restafval": [2], "pbd": [14], "papier": [3], "textiel": [11]},
+    "dar": {"papier": [100, 4], "gft": [1], "restafval": [5], "pbd": [3]},
+    "gad": {"restafval": [1], "gft": [2], "papier": [3], "pbd": [4], "textiel": [6]},
+    "peelenmaas": {"textiel": [7], "papier": [1], "gft": [4], "pbd": [3], "restafval": [2]},
+    "purmerend": {"restafval": [3], "gft": [6], "papier": [1], "textiel": [8], "pbd": [4]},
+    "rmn": {"textiel": [7], "papier": [87], "gft": [3], "pbd": [100], "restafval": [1]},
+    "schouwenduiveland": {"gft": [1], "restafval": [2], "pbd": [3], "textiel": [9], "papier": [7]},
+    "sliedrecht": {"gft": [3], "textiel": [7], "papier": [87], "pbd": [92]},
+    "spaarnelanden": {"pbd": [1], "papier": [1, 21], "gft": [3, 23], "restafval": [26, 7]},
+    "suez": {"gft": [1], "papier": [2], "restafval": [3, 21], "pbd": [4]},
+    "venray": {"restafval": [3], "gft": [4], "papier": [8]},
+    "zrd": {"textiel": [27], "papier": [19], "gft": [11], "pbd": [31], "restafval": [22]},
+    "zuidwestfriesland": {"restafval": [1], "gft": [2], "papier": [3]}
+}
+
+# The ssl option of the request for the locations on the afvalstroom platform that need one
+SENSOR_LOCATIONS_TO_AFVALSTROOM_SSL = {
+    # do not check the certificate, if you do verify, it fails
+    "suez": False,
+}
+
+SENSOR_LOCATIONS_TO_GEMEENTEN = {
+    "afvalstoffendienstkalender": ["haaren", "heusden", "oisterwijk", "s-hertogenbosch", "vught"],
+    "alkmaar": ["alkmaar"],
+    "alphenaandenrijn": ["alphen aan den rijn"],
+    "avalex": ["delft", "leidschendam-voorburg", "midden-delfland", "pijnacker-nootdorp", "rijswijk", "wassenaar"],
+    "beesel": ["beesel"],
+    "berkelland": ["berkelland"],
+    "blink": ["asten", "deurne", "gemert-bakel", "heeze-leende", "laarbeek", "nuenen", "someren"],
+    "borsele": ["borsele"],
+    "circulusberkel": ["apeldoorn", "bronckhorst", "brummen", "deventer", "doesburg", "epe", "lochem", "voorst", "zutphen"],
+    "cranendonck": ["cranendonck"],
+    "cyclus": ["bodegraven-reeuwijk", "gouda", "kaag en braassem", "krimpenerwaard", "montfoort", "nieuwkoop", "waddinxveen", "zuidplas"],
+    "dar": ["berg en dal", "beuningen", "druten", "heumen", "nijmegen", "wijchen"],
+    "deafvalapp": ["boekel", "boxmeer", "buren", "cuijk", "culemborg", "echt-susteren", "grave", "helmond", "maasdriel", "mill en sint hubert", "neder-betuwe", "sint anthonis", "son en breugel", "terneuzen", "tiel", "west betuwe", "west maas en waal", "zaltbommel"],
+    "defriesemeren": ["de friese meren"],
+    "denhaag": ["den haag"],
+    "drimmelen": ["drimmelen"],
+    "gad": ["blaricum", "gooise meren", "hilversum", "huizen", "laren", "weesp", "wijdemeren"],
+    "goereeoverflakkee": ["goeree-overflakkee"],
+    "groningen": ["groningen", "het hogeland bw", "loppersum"],
+    "hoekschewaard": ["hoeksche waard"],
+    "hvc": ["alblasserdam", "bergen", "beverwijk", "den helder", "dordrecht", "drechterland", "enkhuizen", "hendrik-ido-ambacht", "heemskerk", "hollands kroon", "hoorn", "koggenland", "lelystad", "medemblik", "noordoostpolder", "opmeer", "papendrecht", "schagen", "stede broec", "velsen", "wormerland", "zaanstad", "zeewolde", "zwijndrecht"],
+    "irado": ["capelle aan den ijssel", "schiedam", "vlaardingen"],
+    "katwijk": ["katwijk"],
+    "middendrenthe": ["midden-drenthe"],
+    "mijnafvalwijzer": ["aa en hunze", "alphen-chaam", "assen", "altena", "amstelveen", "baarle-nassau", "barneveld", "beek", "beekdaelen", "bergeijk", "bergen op zoom", "bernheze", "best", "bladel", "borger-odoorn", "boxtel", "breda", "brielle", "castricum", "de ronde venen", "de wolden", "de bilt", "doetinchem", "dongen", "dronten", "duiven", "eersel", "eindhoven", "elburg", "ermelo", "etten-leur", "geertruidenberg", "geldrop-mierlo", "gilze en rijen", "goirle", "halderberge", "harderwijk", "heerhugowaard", "heiloo", "hilvarenbeek", "horst aan de maas", "houten", "kampen", "krimpen aan den ijssel", "langedijk", "lansingerland", "leiden", "leiderdorp", "leudal", "leusden", "lingewaard", "loon op zand", "lopik", "maasgouw", "meierijstad", "midden-groningen", "moerdijk", "nijkerk", "noordenveld", "nunspeet", "oirschot", "oldambt", "oldebroek", "oosterhout", "oss", "oude ijsselstreek", "oude pekela", "putten", "oudewater", "overbetuwe", "rheden", "rhenen", "rijssen-holten", "roerdalen", "roermond", "roosendaal", "rotterdam", "rucphen", "scherpenzeel", "sint-michielsgestel", "sittard-geleen", "smallingerland", "stadskanaal", "stein", "stichtse vecht", "teylingen", "tilburg", "tynaarlo", "uitgeest", "utrecht", "utrechtse heuvelrug", "valkenswaard", "veendam", "waalwijk", "waterland", "wijk bij duurstede", "westervoort", "westvoorne", "woensdrecht", "woerden", "zevenaar", "zoetermeer", "zoeterwoude"],
+    "omrin": ["achtkarspelen", "ameland", "appingedam", "dantumadeel f", "harlingen", "heerenveen", "het hogeland", "leeuwarden", "noardeast fryslan", "ooststellingwerf", "opsterland", "terschelling", "tietjerksteradeel", "waadhoeke", "weststellingwerf"],
+    "peelenmaas": ["peel en maas"],
+    "purmerend": ["beemster", "purmerend"],
+    "rd4": ["brunssum", "eijsden-margraten", "gulpen-wittem", "heerlen", "kerkrade", "landgraaf", "maastricht", "meerssen", "simpelveld", "vaals", "valkenburg aan de geul", "voerendaal"],
+    "rmn": ["baarn", "bunnik", "ijsselstein", "nieuwegein", "soest", "zeist"],
+    "rova": ["aalten", "amersfoort", "bunschoten", "dalfsen", "dinkelland", "hardenberg", "hattem", "heerde", "olst-wijhe", "ommen", "oost gelre", "raalte", "staphorst", "steenwijkerland", "tubbergen", "twenterand", "urk", "westerveld", "winterswijk", "woudenberg", "zwartewaterland", "zwolle"],
+    "schouwenduiveland": ["schouwen-duiveland"],
+    "sliedrecht": ["sliedrecht"],
+    "spaarnelanden": ["haarlem", "zandvoort"],
+    "suez": ["arnhem"],
+    "uden": ["uden"],
+    "veldhoven": ["veldhoven"],
+    "venlo": ["venlo"],
+    "venray": ["venray"],
+    "waalre": ["waalre"],
+    "westerkwartier": ["westerkwartier"],
+    "westerwolde": ["westerwolde"],
+    "westland": ["westland"],
+    "ximmio": ["aalsmeer", "albrandswaard", "almelo", "almere", "barendrecht", "bloemendaal", "borne", "coevorden", "diemen", "ede", "emmen", "enschede", "gorinchem", "haaksbergen", "haarlemmermeer", "hardinxveld-giessendam", "heemstede", "hellendoorn", "hengelo", "hillegom", "hof van twente", "hoogeveen", "lisse", "losser", "meppel", "molenlanden", "nissewaard", "noordwijk", "oldenzaal", "renkum", "renswoude", "ridderkerk", "veenendaal", "vijfheerenlanden", "wageningen", "wierden"],
+    "zrd": ["hulst", "kapelle", "noord-beveland", "reimerswaal", "sluis", "tholen", "veere"],
+    "zuidwestfriesland": ["zuidwest-friesland"]
+}
+
+# Gemeenten which are only partially supported, or which are split over more locations
+PARTIAL_GEMEENTEN = {
+    "dantumadeel f": 0.5,
+    "het hogeland": 0.5,
+    "het hogeland bw": 0.5
+}
+
 MONTH_TO_NUMBER = {
     "jan": "01",
     "feb": "02",
@@ -147,8 +235,10 @@ CONF_STREET_NUMBER = "streetnumber"
 CONF_DATE_FORMAT = "dateformat"
 CONF_TIMESPAN_IN_DAYS = "timespanindays"
 CONF_LOCALE = "locale"
+CONF_CACHE_TTL_IN_HOURS = "cachettlinhours"
 SENSOR_PREFIX = "Afvalinfo "
 ATTR_LAST_UPDATE = "last_update"
+ATTR_LAST_FETCHED = "last_fetched"
 ATTR_HIDDEN = "hidden"
 ATTR_IS_COLLECTION_DATE_TODAY = "is_collection_date_today"
 ATTR_DAYS_UNTIL_COLLECTION_DATE = "days_until_collection_date"
@@ -156,4 +246,26 @@ ATTR_YEAR_MONTH_DAY_DATE = "year_month_day_date"
 
 _LOGGER = logging.getLogger(__name__)
 
-MIN_TIME_BETWEEN_UPDATES = timedelta(hours=1)
\ No newline at end of file
+MIN_TIME_BETWEEN_UPDATES = timedelta(hours=1)
+
+HTTP_TIMEOUT = 30
+HTTP_LIMIT_PER_HOST = 4
+HTTP_KEEPALIVE_TIMEOUT = 30
+RETRY_ATTEMPTS = 3
+RETRY_BACKOFF_IN_SECONDS = 2
+CIRCUIT_BREAKER_THRESHOLD = 3
+CIRCUIT_BREAKER_COOLDOWN = timedelta(hours=3)
+
+STORAGE_KEY = DOMAIN
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 10
+
+# The id a location gives an address hardly ever changes
+ADDRESS_CACHE_TTL = timedelta(days=30)
+
+# Ximmio is asked for the dates of timespanindays plus this margin, up to a year
+XIMMIO_WINDOW_MARGIN_IN_DAYS = 14
+XIMMIO_FULL_WINDOW_IN_DAYS = 366
+
+# Collection dates each dateformat and locale remember the text of
+DATE_FORMAT_CACHE_SIZE = 64
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+from functools import lru_cache
+import re
+
+from babel import Locale
+
+from .const.const import DATE_FORMAT_CACHE_SIZE
+
+# The named days and months of strftime, in the names of the locale instead
+NAMED_DIRECTIVES = {
+    "%a": ("days", "abbreviated"),
+    "%A": ("days", "wide"),
+    "%b": ("months", "abbreviated"),
+    "%B": ("months", "wide"),
+}
+NAMED_DIRECTIVE = re.compile("(" + "|".join(NAMED_DIRECTIVES) + ")")
+
+
+@lru_cache(maxsize=None)
+def get_names(locale, kind, width):
+    # {0: "maandag", ...} for days, {1: "januari", ...} for months. Babel only loads
+    # the data of a locale once, here it is also looked up once
+    return dict(getattr(Locale.parse(locale), kind)["format"][width])
+
+
+@lru_cache(maxsize=None)
+def get_date_formatter(date_format, locale):
+    """The formatter of a dateformat and locale, the sensors with the same ones share it."""
+    return DateFormatter(date_format, locale)
+
+
+class DateFormatter(object):
+    """Formats collection dates with a strftime dateformat, the named days and months in the locale."""
+
+    def __init__(self, date_format, locale):
+        self.date_format = date_format
+        self.locale = locale
+        # "%A %d-%B" -> ["", "%A", " %d-", "%B", ""], the odd parts are named days and months
+        self._parts = NAMED_DIRECTIVE.split(date_format)
+        # The names of those in the locale, loaded now so an unknown locale fails at setup
+        self._names = {part: get_names(locale, *NAMED_DIRECTIVES[part]) for part in self._parts[1::2]}
+        # A collection date stays the same for days, so it is formatted only once
+        self.format = lru_cache(maxsize=DATE_FORMAT_CACHE_SIZE)(self._format)
+
+    def _format(self, collection_date):
+        if len(self._parts) == 1:
+            return collection_date.strftime(self.date_format)
+
+        formatted = []
+        for index, part in enumerate(self._parts):
+            if index % 2 == 0:
+                formatted.append(collection_date.strftime(part) if part else "")
+                continue
+            kind, _ = NAMED_DIRECTIVES[part]
+            formatted.append(self._names[part][collection_date.weekday() if kind == "days" else collection_date.month])
+        return "".join(formatted)
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+from .const.const import (
+    ATTR_LAST_FETCHED,
+    ATTR_LAST_UPDATE,
+)
+from homeassistant.core import callback
+from homeassistant.helpers.entity import Entity
+import homeassistant.util.dt as dt_util
+
+# Attributes that don't make a change of the sensor by themselves
+DIAGNOSTIC_ATTRIBUTES = (ATTR_LAST_FETCHED, ATTR_LAST_UPDATE)
+
+
+class AfvalinfoEntity(Entity):
+    """Base for the sensors, which get their state from AfvalinfoData instead of being polled.
+
+    AfvalinfoData tells its sensors when it has new collection dates and when a day has passed,
+    see AfvalinfoData.async_add_listener. Only then the state of a sensor is set again, and it is
+    only written when the state or one of the other attributes than DIAGNOSTIC_ATTRIBUTES changed.
+    """
+
+    _last_update = None
+    _written_state = None
+
+    @property
+    def should_poll(self):
+        return False
+
+    async def async_added_to_hass(self):
+        self.async_on_remove(self.data.async_add_listener(self._async_data_updated))
+
+    async def async_update(self):
+        # Only called for the homeassistant.update_entity service, the sensors of the address
+        # are told about the result by AfvalinfoData
+        await self.data.async_request_refresh()
+
+    @property
+    def last_fetched(self):
+        # When the collection dates were fetched
+        fetched = self.data.fetched
+        return dt_util.as_local(fetched).strftime("%d-%m-%Y %H:%M") if fetched else None
+
+    @callback
+    def _async_data_updated(self):
+        self.update_state()
+        attributes = self.device_state_attributes or {}
+        written_state = (self.state, [
+            (name, value) for name, value in attributes.items() if name not in DIAGNOSTIC_ATTRIBUTES
+        ])
+        if written_state == self._written_state:
+            return
+        self._written_state = written_state
+        # The time the sensor last changed
+        self._last_update = dt_util.now().strftime("%d-%m-%Y %H:%M")
+        self.async_write_ha_state()
+
+    def update_state(self):
+        """Set the state from the collection dates of data."""
+        raise NotImplementedError
@@ -0,0 +1,109 @@
+from ..const.const import (
+    ADDRESS_CACHE_TTL,
+    _LOGGER,
+)
+from datetime import datetime, timedelta, timezone
+import aiohttp
+
+
+class AddressNotFound(ValueError):
+    """The location doesn't know the address (anymore)."""
+
+
+class CachedAddressAfval(object):
+    """Base for the locations which look up an id for the address before they can get the dates.
+
+    The id is kept in address until ADDRESS_CACHE_TTL has passed, AfvalinfoData stores it with the
+    collection dates so it survives a restart. When the location doesn't know the id anymore it is
+    looked up again.
+    """
+
+    address = None
+    address_resolved = None
+
+    async def async_get_address(self, client, postcode, street_number):
+        """The id of the address, anything that can be stored as json."""
+        raise NotImplementedError
+
+    async def async_get_calendar(self, client, address):
+        """The dates for the id of the address, raises AddressNotFound when the id is unknown."""
+        raise NotImplementedError
+
+    def has_address(self):
+        if self.address is None or self.address_resolved is None:
+            return False
+        return datetime.now(timezone.utc) - self.address_resolved < ADDRESS_CACHE_TTL
+
+    async def async_get_address_calendar(self, client, postcode, street_number):
+        if self.has_address():
+            try:
+                return await self._async_get_calendar(client, self.address)
+            except AddressNotFound:
+                _LOGGER.debug("Address %s %s not found with %r, looking it up again", postcode, street_number, self.address)
+
+        self.address = None
+        address = await self.async_get_address(client, postcode, street_number)
+        calendar = await self._async_get_calendar(client, address)
+        self.address = address
+        self.address_resolved = datetime.now(timezone.utc)
+        return calendar
+
+    async def _async_get_calendar(self, client, address):
+        try:
+            return await self.async_get_calendar(client, address)
+        except aiohttp.ClientResponseError as exc:
+            if exc.status == 404:
+                raise AddressNotFound(address) from exc
+            raise
+
+
+class YearCalendarAfval(CachedAddressAfval):
+    """Base for the locations which give the calendar of the id of an address per year.
+
+    Next year is only asked when this year has no date left for one of the requested trash types
+    and the timespan of the sensors reaches into next year, so the sensors don't go blank at the
+    end of December. Next year may not be published yet, then there are only the dates of this year.
+    """
+
+    # afvalstroom_id -> trash type, set by the location
+    AFVALSTROMEN = {}
+    # Set by AfvalinfoData to the longest timespanindays of the sensors, None means a year
+    timespan_in_days = None
+    # The trash types of the last async_get_data
+    resources = ()
+
+    async def async_get_year(self, client, address, year):
+        """The dates of one year for the id of the address, as a list."""
+        raise NotImplementedError
+
+    def get_waste_dict(self, dataList, resources, today):
+        # the dates from today of every requested trash type
+        waste_dict = {}
+        for data in dataList:
+            afvalnaam = self.AFVALSTROMEN.get(data["afvalstroom_id"])
+            if afvalnaam in resources:
+                if datetime.strptime(data["ophaaldatum"], "%Y-%m-%d").date() >= today:
+                    waste_dict.setdefault(afvalnaam, []).append(data["ophaaldatum"])
+        return waste_dict
+
+    def needs_next_year(self, calendar, today):
+        timespan = 365 if self.timespan_in_days is None else self.timespan_in_days
+        if (today + timedelta(days=timespan)).year == today.year:
+            return False
+        waste_dict = self.get_waste_dict(calendar, self.resources, today)
+        return any(
+            not waste_dict.get(afvalnaam) for afvalnaam in set(self.AFVALSTROMEN.values()) if afvalnaam in self.resources
+        )
+
+    async def async_get_years(self, client, address, today):
+        calendar = await self.async_get_year(client, address, today.year)
+        if self.needs_next_year(calendar, today):
+            calendar = calendar + await self._async_get_next_year(client, address, today.year + 1)
+        return calendar
+
+    async def _async_get_next_year(self, client, address, year):
+        try:
+            return await self.async_get_year(client, address, year)
+        except aiohttp.ClientResponseError as exc:
+            _LOGGER.debug("No calendar for %s yet: %r", year, exc)
+            return []
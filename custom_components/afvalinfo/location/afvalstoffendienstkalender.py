@@ -1,43 +1,21 @@
 from ..const.const import (
-    MONTH_TO_NUMBER,
     SENSOR_LOCATIONS_TO_URL,
     _LOGGER,
 )
+from ..schedule import CollectionSchedule
+from ..soup import make_soup
+from .jaaroverzicht import Jaaroverzicht
 from datetime import datetime
 from datetime import timedelta
-from bs4 import BeautifulSoup
-import urllib.request
-import urllib.error
+from bs4 import SoupStrainer
+import aiohttp
 
+# Only this part of the page is parsed
+CONTAINER = SoupStrainer(id="jaaroverzicht")
 
-class AfvalstoffendienstkalenderAfval(object):
-    def get_date_from_afvaltype(self, html, afvaltype, afvalnaam):
-        try:
-            results = html.findAll("p", {"class": afvaltype})
-
-            for result in results:
-                result = str(result).split(">")
-
-                date = result[1].split("<")[0]
 
-                day = date.split()[1]
-                month = MONTH_TO_NUMBER[date.split()[2]]
-                # the year is always this year because it's a 'jaaroverzicht'
-                year = datetime.today().year
-
-                if int(month) >= datetime.today().month:
-                    if int(month) == datetime.today().month:
-                        if int(day) >= datetime.today().day:
-                            return str(year) + "-" + str(month) + "-" + str(day)
-                    else:
-                        return str(year) + "-" + str(month) + "-" + str(day)
-            # if nothing was found
-            return ""
-        except Exception as exc:
-            _LOGGER.warning("Something went wrong while splitting data: %r. This probably means that trash type %r is not supported on your location", exc, afvalnaam)
-            return ""
-
-    def get_data(self, city, postcode, street_number, resources):
+class AfvalstoffendienstkalenderAfval(object):
+    async def async_get_data(self, client, city, postcode, street_number, resources):
         _LOGGER.debug("Updating Waste collection dates")
 
         try:
@@ -50,41 +28,31 @@ class AfvalstoffendienstkalenderAfval(object):
                 url = SENSOR_LOCATIONS_TO_URL["afvalstoffendienstkalender"][0].format(
                     city, postcode, street_number
                 )
-            req = urllib.request.Request(url=url)
-            f = urllib.request.urlopen(req)
-            html = f.read().decode("utf-8")
+            html = await client.get_text(url)
 
-            soup = BeautifulSoup(html, "html.parser")
-            jaaroverzicht = soup.find(id="jaaroverzicht")
+            soup = make_soup(html, CONTAINER)
+            jaaroverzicht = Jaaroverzicht(soup.find(id="jaaroverzicht"), datetime.today().date())
 
             # Place all possible values in the dictionary even if they are not necessary
             waste_dict = {}
 
             # find gft. In some locations it's 'gft' and in other locations it's 'restgft'
             if "gft" in resources:
-                waste_dict["gft"] = self.get_date_from_afvaltype(jaaroverzicht, "gft", "gft")
-                if len(waste_dict["gft"]) == 0:
-                    waste_dict["gft"] = self.get_date_from_afvaltype(jaaroverzicht, "restgft", "gft")
+                waste_dict["gft"] = jaaroverzicht.get_dates_from_afvaltype(("gft", "restgft"), "gft")
             # find papier
             if "papier" in resources:
-                waste_dict["papier"] = self.get_date_from_afvaltype(jaaroverzicht, "papier", "papier")
+                waste_dict["papier"] = jaaroverzicht.get_dates_from_afvaltype(("papier",), "papier")
             # find pbd. In some locations it's 'pd' and in other locations it's 'pmb' or 'plastic'
             if "pbd" in resources:
-                waste_dict["pbd"] = self.get_date_from_afvaltype(jaaroverzicht, "pd", "pbd")
-                if len(waste_dict["pbd"]) == 0:
-                    waste_dict["pbd"] = self.get_date_from_afvaltype(jaaroverzicht, "pmd", "pbd")
-                if len(waste_dict["pbd"]) == 0:
-                    waste_dict["pbd"] = self.get_date_from_afvaltype(jaaroverzicht, "plastic", "pbd")
+                waste_dict["pbd"] = jaaroverzicht.get_dates_from_afvaltype(("pd", "pmd", "plastic"), "pbd")
             # find restafval. In some locations it's 'restafval' and in other locations it's 'restgft'
             if "restafval" in resources:
-                waste_dict["restafval"] = self.get_date_from_afvaltype(jaaroverzicht, "restafval", "restafval")
-                if len(waste_dict["restafval"]) == 0:
-                    waste_dict["restafval"] = self.get_date_from_afvaltype(jaaroverzicht, "restgft", "restafval")
+                waste_dict["restafval"] = jaaroverzicht.get_dates_from_afvaltype(("restafval", "restgft"), "restafval")
             # find textiel
             if "textiel" in resources:
-                waste_dict["textiel"] = self.get_date_from_afvaltype(jaaroverzicht, "textiel", "textiel")
+                waste_dict["textiel"] = jaaroverzicht.get_dates_from_afvaltype(("textiel",), "textiel")
 
-            return waste_dict
-        except urllib.error.URLError as exc:
-            _LOGGER.error("Error occurred while fetching data: %r", exc.reason)
+            return CollectionSchedule.from_waste_dict(waste_dict)
+        except aiohttp.ClientError as exc:
+            _LOGGER.error("Error occurred while fetching data: %r", exc)
             return False
@@ -0,0 +1,79 @@
+from ..const.const import (
+    MONTH_TO_NUMBER,
+    SENSOR_LOCATIONS_TO_AFVALSTROOM,
+    SENSOR_LOCATIONS_TO_AFVALSTROOM_SSL,
+    SENSOR_LOCATIONS_TO_URL,
+    _LOGGER,
+)
+from ..schedule import CollectionSchedule
+from ..soup import make_soup
+from .registry import GEMEENTE_TO_LOCATION
+from datetime import datetime
+from bs4 import SoupStrainer
+import aiohttp
+
+# Only this part of the page is parsed
+CONTAINER = SoupStrainer(id="ophaaldata")
+
+AFVALSTROOM_HREF = "/afvalstroom/"
+
+
+class AfvalstroomAfval(object):
+    """All the locations on the "adres/{postcode}:{number}" platform, see SENSOR_LOCATIONS_TO_AFVALSTROOM."""
+
+    def get_links_by_afvalstroom(self, ophaaldata):
+        # every afvalstroom links to "/afvalstroom/{id}" with the next date in an <i> element inside the link
+        # like "di 24 november", only the first link of an id is used
+        links = {}
+        for link in ophaaldata.find_all(href=True):
+            href = link["href"]
+            if href.startswith(AFVALSTROOM_HREF):
+                links.setdefault(href[len(AFVALSTROOM_HREF):], link)
+        return links
+
+    def get_date_from_afvalstroom(self, link):
+        date = link.i.string[3:]
+        day = date.split()[0]
+        month = MONTH_TO_NUMBER[date.split()[1]]
+        year = str(
+            datetime.today().year
+            if datetime.today().month <= int(month)
+            else datetime.today().year + 1
+        )
+        return year + "-" + month + "-" + day
+
+    def get_date_from_afvaltype(self, links, afvalstromen, afvalnaam):
+        # the first afvalstroom with a date
+        for afvalstroom in afvalstromen:
+            try:
+                return self.get_date_from_afvalstroom(links[str(afvalstroom)])
+            except Exception as exc:
+                _LOGGER.warning("Something went wrong while splitting data: %r. This probably means that trash type %r is not supported on your location", exc, afvalnaam)
+        return ""
+
+    async def async_get_data(self, client, city, postcode, street_number, resources):
+        _LOGGER.debug("Updating Waste collection dates")
+
+        try:
+            location = GEMEENTE_TO_LOCATION[city]
+            url = SENSOR_LOCATIONS_TO_URL[location][0].format(
+                postcode, street_number
+            )
+            kwargs = {}
+            if location in SENSOR_LOCATIONS_TO_AFVALSTROOM_SSL:
+                kwargs["ssl"] = SENSOR_LOCATIONS_TO_AFVALSTROOM_SSL[location]
+            html = await client.get_text(url, **kwargs)
+
+            soup = make_soup(html, CONTAINER)
+            links = self.get_links_by_afvalstroom(soup.find(id="ophaaldata"))
+
+            # Place all possible values in the dictionary even if they are not necessary
+            waste_dict = {}
+            for afvalnaam, afvalstromen in SENSOR_LOCATIONS_TO_AFVALSTROOM[location].items():
+                if afvalnaam in resources:
+                    waste_dict[afvalnaam] = self.get_date_from_afvaltype(links, afvalstromen, afvalnaam)
+
+            return CollectionSchedule.from_waste_dict(waste_dict)
+        except aiohttp.ClientError as exc:
+            _LOGGER.error("Error occurred while fetching data: %r", exc)
+            return False
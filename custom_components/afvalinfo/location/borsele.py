@@ -3,11 +3,16 @@ from ..const.const import (
     SENSOR_LOCATIONS_TO_URL,
     _LOGGER,
 )
+from ..schedule import CollectionSchedule
+from ..soup import make_soup
 from datetime import datetime
 from datetime import timedelta
-from bs4 import BeautifulSoup
-import urllib.request
-import urllib.error
+from bs4 import SoupStrainer
+import aiohttp
+
+# Only this part of the page is parsed
+CONTAINER = SoupStrainer(id="garbage-dates")
+
 
 class BorseleAfval(object):
     def get_date_from_afvaltype(self, ophaaldata, afvaltype, afvalnaam):
@@ -30,18 +35,16 @@ class BorseleAfval(object):
             _LOGGER.warning("Something went wrong while splitting data: %r. This probably means that trash type %r is not supported on your location", exc, afvalnaam)
             return ""
 
-    def get_data(self, city, postcode, street_number, resources):
+    async def async_get_data(self, client, city, postcode, street_number, resources):
         _LOGGER.debug("Updating Waste collection dates")
 
         try:
             url = SENSOR_LOCATIONS_TO_URL["borsele"][0].format(
                 postcode, street_number
             )
-            req = urllib.request.Request(url=url)
-            f = urllib.request.urlopen(req)
-            html = f.read().decode("utf-8")
+            html = await client.get_text(url)
 
-            soup = BeautifulSoup(html, "html.parser")
+            soup = make_soup(html, CONTAINER)
             ophaaldata = soup.find(id="garbage-dates")
             ophaaldata = ophaaldata.find_all("tr")
 
@@ -57,7 +60,7 @@ class BorseleAfval(object):
             if "papier" in resources:
                 waste_dict["papier"] = self.get_date_from_afvaltype(ophaaldata, "icon-blauwe-container", "papier")
 
-            return waste_dict
-        except urllib.error.URLError as exc:
+            return CollectionSchedule.from_waste_dict(waste_dict)
+        except aiohttp.ClientError as exc:
             _LOGGER.error("Error occurred while fetching data: %r", exc)
             return False
\ No newline at end of file
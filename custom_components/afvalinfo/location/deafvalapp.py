@@ -3,27 +3,48 @@ from ..const.const import (
     SENSOR_LOCATIONS_TO_URL,
     _LOGGER,
 )
+from ..schedule import CollectionSchedule
+from ..soup import make_soup
+from .session import CookieSessionAfval
 from datetime import datetime
 from datetime import timedelta
-from bs4 import BeautifulSoup
-import urllib.request
-import urllib.error
-import http.cookiejar
+from bs4 import SoupStrainer
+import aiohttp
 
+# Only this part of the page is parsed
+CONTAINER = SoupStrainer("div", {"class": "ophaaldagen"})
 
-class DeAfvalAppAfval(object):
-    def get_date_from_afvaltype(self, ophaaldata, afvaltype, afvalnaam):
-        try:
-            # get index of the <a> element, which is just before our <p> element with the date
-            searchString = "=" + afvaltype + "\">"
-            i = str(ophaaldata).index(searchString) + len(searchString)
 
-            # get the <p> element with the date in it
-            date = BeautifulSoup(str(ophaaldata)[i:], "html.parser").find(
-                "p", {"class": "date"}
-            )
-            # get the content of <p>
-            date = date.string
+class DeAfvalAppAfval(CookieSessionAfval):
+    async def async_start_session(self, session, postcode, street_number):
+        # first call to save cookie, the session remembers the address
+        url = SENSOR_LOCATIONS_TO_URL["deafvalapp"][0].format(
+            postcode, street_number
+        )
+        await session.request("GET", url)
+
+    async def async_get_page(self, session, postcode, street_number):
+        # second call to fetch data
+        return await session.get_text(SENSOR_LOCATIONS_TO_URL["deafvalapp"][1])
+
+    def is_session_page(self, page):
+        # without a session there are no ophaaldagen
+        return "ophaaldagen" in page
+
+    def get_dates_by_afvaltype(self, ophaaldata):
+        # every <a> links to the calendar of its trash type (...?type=GFT), the <p> element
+        # with the date comes right after it. Only the first date of a type is used
+        dates = {}
+        for link in ophaaldata.find_all("a", href=True):
+            afvaltype = link["href"].rsplit("=", 1)[-1]
+            if afvaltype not in dates:
+                dates[afvaltype] = link.find_next("p", {"class": "date"})
+        return dates
+
+    def get_date_from_afvaltype(self, dates, afvaltype, afvalnaam):
+        try:
+            # get the content of the <p> element with the date in it
+            date = dates[afvaltype].string
 
             day = date.split()[1]
             month = MONTH_TO_NUMBER[date.split()[2]]
@@ -37,50 +58,39 @@ class DeAfvalAppAfval(object):
             _LOGGER.warning("Something went wrong while splitting data: %r. This probably means that trash type %r is not supported on your location", exc, afvalnaam)
             return ""
 
-    def get_data(self, city, postcode, street_number, resources):
+    async def async_get_data(self, client, city, postcode, street_number, resources):
         _LOGGER.debug("Updating Waste collection dates")
 
         try:
-            # Storing cookies in cj variable
-            cj = http.cookiejar.CookieJar()
-
-            # Defining a handler for later http operations with cookies(cj).
-            op = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(cj))
-
-            # first call to save cookie
-            url = SENSOR_LOCATIONS_TO_URL["deafvalapp"][0].format(
-                postcode, street_number
-            )
-            res = op.open(url)
+            # Client with the cookie jar of this address, the first call is only needed for a new session
+            html = await self.async_get_session_page(client, postcode, street_number)
 
-            # second call to fetch data
-            res = op.open(SENSOR_LOCATIONS_TO_URL["deafvalapp"][1])
-            html = res.read().decode("utf-8")
-            soup = BeautifulSoup(html, "html.parser")
+            soup = make_soup(html, CONTAINER)
             ophaaldata = soup.find("div", {"class": "ophaaldagen"})
+            dates = self.get_dates_by_afvaltype(ophaaldata)
 
             # Place all possible values in the dictionary even if they are not necessary
             waste_dict = {}
             # find gft
             if "gft" in resources:
-                waste_dict["gft"] = self.get_date_from_afvaltype(ophaaldata, "GFT", "gft")
+                waste_dict["gft"] = self.get_date_from_afvaltype(dates, "GFT", "gft")
             # find papiers
             if "papier" in resources:
-                waste_dict["papier"] = self.get_date_from_afvaltype(ophaaldata, "PAPIER", "papier")
+                waste_dict["papier"] = self.get_date_from_afvaltype(dates, "PAPIER", "papier")
             # find pbd / pmd
             if "pbd" in resources:
-                waste_dict["pbd"] = self.get_date_from_afvaltype(ophaaldata, "PMD", "pbd")
+                waste_dict["pbd"] = self.get_date_from_afvaltype(dates, "PMD", "pbd")
                 if len(waste_dict["pbd"]) == 0:
-                    waste_dict["pbd"] = self.get_date_from_afvaltype(ophaaldata, "PLASTIC", "pbd")
+                    waste_dict["pbd"] = self.get_date_from_afvaltype(dates, "PLASTIC", "pbd")
                 if len(waste_dict["pbd"]) == 0:
-                    waste_dict["pbd"] = self.get_date_from_afvaltype(ophaaldata, "PBP", "pbd")
+                    waste_dict["pbd"] = self.get_date_from_afvaltype(dates, "PBP", "pbd")
             # find restafval
             if "restafval" in resources:
-                waste_dict["restafval"] = self.get_date_from_afvaltype(ophaaldata, "REST", "restafval")
+                waste_dict["restafval"] = self.get_date_from_afvaltype(dates, "REST", "restafval")
                 if len(waste_dict["restafval"]) == 0:
-                    waste_dict["restafval"] = self.get_date_from_afvaltype(ophaaldata, "ZAK_BLAUW", "restafval")
+                    waste_dict["restafval"] = self.get_date_from_afvaltype(dates, "ZAK_BLAUW", "restafval")
 
-            return waste_dict
-        except urllib.error.URLError as exc:
-            _LOGGER.error("Error occurred while fetching data: %r", exc.reason)
+            return CollectionSchedule.from_waste_dict(waste_dict)
+        except aiohttp.ClientError as exc:
+            _LOGGER.error("Error occurred while fetching data: %r", exc)
             return False
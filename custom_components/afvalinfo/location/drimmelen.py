@@ -3,68 +3,80 @@ from ..const.const import (
     SENSOR_LOCATIONS_TO_URL,
     _LOGGER,
 )
+from ..schedule import CollectionSchedule
+from ..soup import make_soup
 from datetime import datetime
 from datetime import timedelta
-from bs4 import BeautifulSoup
-import urllib.request
-import urllib.error
+from bs4 import SoupStrainer
+import aiohttp
+
+# Only this part of the page is parsed
+CONTAINER = SoupStrainer(id="main-wrapper")
 
 
 class DrimmelenAfval(object):
-    def get_date_from_afvaltype(self, ophaaldata, afvaltype, afvalnaam):
+    def get_dates_by_afvaltype(self, ophaaldata):
+        # the alt text of the image in a row is the trash type, the first row of a type has the next date
+        rows = {}
+        for data in ophaaldata:
+            for img in data.find_all("img", alt=True):
+                afvaltype = img["alt"].lower()
+                if afvaltype not in rows:
+                    rows[afvaltype] = data
+        return rows
+
+    def get_date_from_afvaltype(self, rows, afvaltype, afvalnaam):
         try:
-            for data in ophaaldata:
-                result = data.find("img", {"alt": afvaltype})
-                if result:
-                    date = data.find("td", {"class": "trash-date"})
-                    day = str(date).split()[2]
-                    month = data.find("span", {"class": "element-invisible"}).string
-                    month = MONTH_TO_NUMBER[month]
-                    year = str(
-                        datetime.today().year
-                        if datetime.today().month <= int(month)
-                        else datetime.today().year + 1
-                    )
-                    return year + "-" + month + "-" + day
-            return ""
+            data = rows.get(afvaltype)
+            if data is None:
+                return ""
+            date = data.find("td", {"class": "trash-date"})
+            day = date.get_text().split()[1]
+            month = data.find("span", {"class": "element-invisible"}).string.lower()
+            month = MONTH_TO_NUMBER[month]
+            year = str(
+                datetime.today().year
+                if datetime.today().month <= int(month)
+                else datetime.today().year + 1
+            )
+            return year + "-" + month + "-" + day
         except Exception as exc:
             _LOGGER.warning("Something went wrong while splitting data: %r. This probably means that trash type %r is not supported on your location", exc, afvalnaam)
             return ""
 
-    def get_data(self, city, postcode, street_number, resources):
+    async def async_get_data(self, client, city, postcode, street_number, resources):
         _LOGGER.debug("Updating Waste collection dates")
 
         try:
             url = SENSOR_LOCATIONS_TO_URL["drimmelen"][0].format(
                 postcode, street_number
             )
-            req = urllib.request.Request(url=url)
-            f = urllib.request.urlopen(req)
-            html = f.read().decode("utf-8")
+            html = await client.get_text(url)
 
-            soup = BeautifulSoup(str(html).lower(), "html.parser")
+            soup = make_soup(html, CONTAINER)
             ophaaldata = soup.find(id="main-wrapper")
             ophaaldata = ophaaldata.find_all("tr", {"class": ["odd", "even"]})
+            rows = self.get_dates_by_afvaltype(ophaaldata)
 
             # Place all possible values in the dictionary even if they are not necessary
             waste_dict = {}
             # GFT
             if "gft" in resources:
-                waste_dict["gft"] = self.get_date_from_afvaltype(ophaaldata, "gft", "gft")
+                waste_dict["gft"] = self.get_date_from_afvaltype(rows, "gft", "gft")
             # Textiel
             if "textiel" in resources:
-                waste_dict["textiel"] = self.get_date_from_afvaltype(ophaaldata, "textiel", "textiel")
+                waste_dict["textiel"] = self.get_date_from_afvaltype(rows, "textiel", "textiel")
             # Papier
             if "papier" in resources:
-                waste_dict["papier"] = self.get_date_from_afvaltype(ophaaldata, "papier", "papier")
+                waste_dict["papier"] = self.get_date_from_afvaltype(rows, "papier", "papier")
             # Restafval
             if "papier" in resources:
-                waste_dict["restafval"] = self.get_date_from_afvaltype(ophaaldata, "restafval", "papier")
+                waste_dict["restafval"] = self.get_date_from_afvaltype(rows, "restafval", "papier")
             # Plastic
             if "pbd" in resources:
-                waste_dict["pbd"] = self.get_date_from_afvaltype(ophaaldata, "plastic", "pbd")
+                waste_dict["pbd"] = self.get_date_from_afvaltype(rows, "plastic", "pbd")
 
-            return waste_dict
-        except urllib.error.URLError as exc:
-            _LOGGER.error("Error occurred while fetching data: %r", exc.reason)
+            return CollectionSchedule.from_waste_dict(waste_dict)
+        except aiohttp.ClientError as exc:
+            _LOGGER.error("Error occurred while fetching data: %r", exc)
             return False
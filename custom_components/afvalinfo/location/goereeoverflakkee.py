@@ -3,11 +3,10 @@ from ..const.const import (
     SENSOR_LOCATIONS_TO_URL,
     _LOGGER,
 )
+from ..schedule import CollectionSchedule
 
 from datetime import datetime
-import urllib.request
-import urllib.error
-import requests
+import aiohttp
 import json
 
 from datetime import date
@@ -17,9 +16,9 @@ from dateutil.relativedelta import relativedelta
 class GoereeOverflakkeeAfval(object):
     def get_date_from_afvaltype(self, data, afvalnaam):
         try:
-            date = data["datum"]
-            day = date.split()[1]
-            month = MONTH_TO_NUMBER[date.split()[2]]
+            pickup_date = data["datum"]
+            day = pickup_date.split()[1]
+            month = MONTH_TO_NUMBER[pickup_date.split()[2]]
             year = str(
                 datetime.today().year
                 if datetime.today().month <= int(month)
@@ -30,7 +29,7 @@ class GoereeOverflakkeeAfval(object):
             _LOGGER.warning("Something went wrong while splitting data: %r. This probably means that trash type %r is not supported on your location", exc, afvalnaam)
             return ""
 
-    def get_data(self, city, postcode, street_number, resources):
+    async def async_get_data(self, client, city, postcode, street_number, resources):
         _LOGGER.debug("Updating Waste collection dates")
 
         try:
@@ -44,25 +43,25 @@ class GoereeOverflakkeeAfval(object):
             )
 
             # sending get request
-            r = requests.get(url=API_ENDPOINT)
+            content = await client.request("GET", API_ENDPOINT)
 
-            containers = r.content[1:]
+            containers = content[1:]
             containers = containers[:len(containers)-1]
 
             jsonResult = json.loads(containers)["containers"][0]["container"]
 
             for data in jsonResult:
                 if "gft" in resources:
-                    if data["class"] == "ak_gft" and "gft" not in waste_dict:
-                        waste_dict["gft"] = self.get_date_from_afvaltype(data, "gft")
+                    if data["class"] == "ak_gft":
+                        waste_dict.setdefault("gft", []).append(self.get_date_from_afvaltype(data, "gft"))
                 if "restafval" in resources:
-                    if data["class"] == "ak_rest" and "restafval" not in waste_dict:
-                        waste_dict["restafval"] = self.get_date_from_afvaltype(data, "restafval")
+                    if data["class"] == "ak_rest":
+                        waste_dict.setdefault("restafval", []).append(self.get_date_from_afvaltype(data, "restafval"))
                 if "papier" in resources:
-                    if data["class"] == "ak_papier" and "papier" not in waste_dict:
-                        waste_dict["papier"] = self.get_date_from_afvaltype(data, "papier")
+                    if data["class"] == "ak_papier":
+                        waste_dict.setdefault("papier", []).append(self.get_date_from_afvaltype(data, "papier"))
 
-            return waste_dict
-        except urllib.error.URLError as exc:
-            _LOGGER.error("Error occurred while fetching data: %r", exc.reason)
+            return CollectionSchedule.from_waste_dict(waste_dict)
+        except aiohttp.ClientError as exc:
+            _LOGGER.error("Error occurred while fetching data: %r", exc)
             return False
@@ -3,11 +3,15 @@ from ..const.const import (
     SENSOR_LOCATIONS_TO_URL,
     _LOGGER,
 )
+from ..schedule import CollectionSchedule
+from ..soup import make_soup
 from datetime import datetime
 from datetime import timedelta
-from bs4 import BeautifulSoup
-import urllib.request
-import urllib.error
+from bs4 import SoupStrainer
+import aiohttp
+
+# Only this part of the page is parsed
+CONTAINER = SoupStrainer("table", {"class": "afvalwijzerData"})
 
 
 class GroningenAfval(object):
@@ -32,7 +36,7 @@ class GroningenAfval(object):
             _LOGGER.warning("Something went wrong while splitting data: %r. This probably means that trash type %r is not supported on your location", exc, afvalnaam)
             return ""
 
-    def get_data(self, city, postcode, street_number, resources):
+    async def async_get_data(self, client, city, postcode, street_number, resources):
         _LOGGER.debug("Updating Waste collection dates")
 
         try:
@@ -41,11 +45,9 @@ class GroningenAfval(object):
             url = SENSOR_LOCATIONS_TO_URL["groningen"][0].format(
                 postcode, street_number, thisYear
             )
-            req = urllib.request.Request(url=url)
-            f = urllib.request.urlopen(req)
-            html = f.read().decode("utf-8")
+            html = await client.get_text(url)
 
-            soup = BeautifulSoup(html, "html.parser")
+            soup = make_soup(html, CONTAINER)
             table = soup.find("table", {"class": "afvalwijzerData"})
             tbody = table.find("tbody")
             ophaaldata = tbody.find_all("tr")
@@ -61,7 +63,7 @@ class GroningenAfval(object):
             if "restafval" in resources:
                 waste_dict["restafval"] = self.get_date_from_afvaltype(ophaaldata, "HGRIJS", "restafval")
 
-            return waste_dict
-        except urllib.error.URLError as exc:
+            return CollectionSchedule.from_waste_dict(waste_dict)
+        except aiohttp.ClientError as exc:
             _LOGGER.error("Error occurred while fetching data: %r", exc)
             return False
@@ -3,17 +3,33 @@ from ..const.const import (
     SENSOR_LOCATIONS_TO_URL,
     _LOGGER,
 )
+from ..schedule import CollectionSchedule
+from ..soup import make_soup
+from .session import CookieSessionAfval
 from datetime import datetime
 from datetime import timedelta
 from dateutil.relativedelta import relativedelta
-from bs4 import BeautifulSoup
-import urllib.request
-import urllib.error
-import http.cookiejar
+from bs4 import SoupStrainer
+import aiohttp
 import json
 
+# Only this part of the page is parsed
+CONTAINER = SoupStrainer("div", {"class": "avk-block avk-next-pickup"})
+
+
+class IradoAfval(CookieSessionAfval):
+    async def async_get_page(self, session, postcode, street_number):
+        data = {
+            "appointment_zipcode": postcode[:4],
+            "appointment_zipcode_suffix": postcode[4:],
+            "appointment_housenumber": street_number,
+            "appointment_housenumber_suffix": "",
+            "wsa_calendar": "364b570c83"
+        }
+
+        # sending post request and read the data
+        return await session.post_text(SENSOR_LOCATIONS_TO_URL["irado"][0], data=data)
 
-class IradoAfval(object):
     def get_date_from_afvaltype(self, data, afvaltype, afvalnaam):
         try:
             html = data.find("div", {"class": "avk-block-row pickup-type-item " + str(afvaltype) + " active"})
@@ -33,37 +49,14 @@ class IradoAfval(object):
             return ""
 
 
-    def get_data(self, city, postcode, street_number, resources):
+    async def async_get_data(self, client, city, postcode, street_number, resources):
         _LOGGER.debug("Updating Waste collection dates")
 
         try:
-            # Storing cookies in cj variable
-            cj = http.cookiejar.CookieJar()
-
-            # Defining a handler for later http operations with cookies(cj).
-            op = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(cj))
-
-            url = SENSOR_LOCATIONS_TO_URL["irado"][0]
-
-            data = {
-                "appointment_zipcode": postcode[:4],
-                "appointment_zipcode_suffix": postcode[4:],
-                "appointment_housenumber": street_number,
-                "appointment_housenumber_suffix": "",
-                "wsa_calendar": "364b570c83"
-            }
-
-            postdata = urllib.parse.urlencode(data).encode()
-
-            # sending post request and saving response as response object
-            request = urllib.request.Request(url, postdata)
-            #open the response object
-            response = op.open(request)
-
-            #read the data
-            html = response.read().decode("utf-8")
+            # Client with the cookie jar of this address
+            html = await self.async_get_session_page(client, postcode, street_number)
 
-            soup = BeautifulSoup(html, "html.parser")
+            soup = make_soup(html, CONTAINER)
             nextPickup = soup.find("div", {"class": ['avk-block avk-next-pickup']})
 
             # Place all possible values in the dictionary even if they are not necessary
@@ -78,7 +71,7 @@ class IradoAfval(object):
             if "pbd" in resources:
                 waste_dict["pbd"] = self.get_date_from_afvaltype(nextPickup, "pickup-type-item-kunststof", "pbd")
 
-            return waste_dict
-        except urllib.error.URLError as exc:
-            _LOGGER.error("Error occurred while fetching data: %r", exc.reason)
+            return CollectionSchedule.from_waste_dict(waste_dict)
+        except aiohttp.ClientError as exc:
+            _LOGGER.error("Error occurred while fetching data: %r", exc)
             return False
\ No newline at end of file
@@ -0,0 +1,63 @@
+from ..const.const import (
+    MONTH_TO_NUMBER,
+    _LOGGER,
+)
+from datetime import date
+
+
+class Jaaroverzicht(object):
+    """The collection dates of a year overview per class of its <p> elements, from today."""
+
+    def __init__(self, html, today):
+        # Walk the overview once. The <p> elements have the trash type as class, their text is
+        # like 'dinsdag 5 januari' without a year. The overview starts in this year and the dates
+        # of a class are in calendar order, a month lower than the one before it in the same class
+        # means the next year has started. The overview covers no more than that next year
+        self._dates = {}
+        self._errors = {}
+        # the (year, month) of the last date of every class
+        lastMonths = {}
+
+        for result in html.find_all("p", class_=True):
+            try:
+                # Sometimes the date is in a span with class span-line-break
+                # and sometimes it is the text of the <p> itself
+                span = result.find("span", {"class": "span-line-break"})
+                text = span.string if span is not None else next(result.strings, None)
+
+                day = int(text.split()[1])
+                month = int(MONTH_TO_NUMBER[text.split()[2]])
+            except Exception as exc:
+                # only a problem when nothing else is found for this class
+                for afvaltype in result["class"]:
+                    self._errors.setdefault(afvaltype, exc)
+                continue
+
+            for afvaltype in result["class"]:
+                year, previousMonth = lastMonths.get(afvaltype, (today.year, 0))
+                if month < previousMonth and year == today.year:
+                    year += 1
+                lastMonths[afvaltype] = (year, month)
+
+                try:
+                    collection_date = date(year, month, day)
+                except ValueError as exc:
+                    self._errors.setdefault(afvaltype, exc)
+                    continue
+                if collection_date >= today:
+                    self._dates.setdefault(afvaltype, []).append(collection_date)
+
+        for dates in self._dates.values():
+            dates.sort()
+
+    def get_dates_from_afvaltype(self, afvaltypes, afvalnaam):
+        # The dates of the first class in afvaltypes that has any,
+        # locations use different classes for the same trash
+        for afvaltype in afvaltypes:
+            if self._dates.get(afvaltype):
+                return list(self._dates[afvaltype])
+        for afvaltype in afvaltypes:
+            if afvaltype in self._errors:
+                _LOGGER.warning("Something went wrong while splitting data: %r. This probably means that trash type %r is not supported on your location", self._errors[afvaltype], afvalnaam)
+                break
+        return []
@@ -3,17 +3,30 @@ from ..const.const import (
     SENSOR_LOCATIONS_TO_URL,
     _LOGGER,
 )
+from ..schedule import CollectionSchedule
+from ..soup import make_soup
+from .session import CookieSessionAfval
 from datetime import datetime
 from datetime import timedelta
 from dateutil.relativedelta import relativedelta
-from bs4 import BeautifulSoup
-import urllib.request
-import urllib.error
-import http.cookiejar
+from bs4 import SoupStrainer
+import aiohttp
 import json
 
+# Only this part of the page is parsed
+CONTAINER = SoupStrainer("div", {"class": "tx-wind-waste-calendar"})
+
+
+class KatwijkAfval(CookieSessionAfval):
+    async def async_get_page(self, session, postcode, street_number):
+        data = {
+            "tx_windwastecalendar_pi1[zipcode]": postcode[:4] + "+" + postcode[4:],
+            "tx_windwastecalendar_pi1[housenumber]": street_number,
+        }
+
+        # sending post request and read the data
+        return await session.post_text(SENSOR_LOCATIONS_TO_URL["katwijk"][0], data=data)
 
-class KatwijkAfval(object):
     def get_date_from_afvaltype(self, ophaaldata, afvaltype, afvalnaam):
         try:
             for data in ophaaldata:
@@ -36,34 +49,14 @@ class KatwijkAfval(object):
             return ""
 
 
-    def get_data(self, city, postcode, street_number, resources):
+    async def async_get_data(self, client, city, postcode, street_number, resources):
         _LOGGER.debug("Updating Waste collection dates")
 
         try:
-            # Storing cookies in cj variable
-            cj = http.cookiejar.CookieJar()
-
-            # Defining a handler for later http operations with cookies(cj).
-            op = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(cj))
-
-            url = SENSOR_LOCATIONS_TO_URL["katwijk"][0]
-
-            data = {
-                "tx_windwastecalendar_pi1[zipcode]": postcode[:4] + "+" + postcode[4:],
-                "tx_windwastecalendar_pi1[housenumber]": street_number,
-            }
-
-            postdata = urllib.parse.urlencode(data).encode()
-
-            # sending post request and saving response as response object
-            request = urllib.request.Request(url, postdata)
-            #open the response object
-            response = op.open(request)
-
-            #read the data
-            html = response.read().decode("utf-8")
+            # Client with the cookie jar of this address
+            html = await self.async_get_session_page(client, postcode, street_number)
 
-            soup = BeautifulSoup(html, "html.parser")
+            soup = make_soup(html, CONTAINER)
 
             mainDiv = soup.find("div", {"class": ['tx-wind-waste-calendar']})
 
@@ -77,7 +70,7 @@ class KatwijkAfval(object):
             if "gft" in resources:
                 waste_dict["gft"] = self.get_date_from_afvaltype(wasteCalendar, "groenecontainer", "gft")
 
-            return waste_dict
-        except urllib.error.URLError as exc:
-            _LOGGER.error("Error occurred while fetching data: %r", exc.reason)
+            return CollectionSchedule.from_waste_dict(waste_dict)
+        except aiohttp.ClientError as exc:
+            _LOGGER.error("Error occurred while fetching data: %r", exc)
             return False
\ No newline at end of file
@@ -3,24 +3,46 @@ from ..const.const import (
     SENSOR_LOCATIONS_TO_URL,
     _LOGGER,
 )
+from ..schedule import CollectionSchedule
+from ..soup import make_soup
+from .session import CookieSessionAfval
 from datetime import datetime, date, timedelta
-from bs4 import BeautifulSoup
-import urllib.request
-import urllib.error
-import requests
-import http.cookiejar
+from bs4 import SoupStrainer
+import aiohttp
 import re
 
+# Only this part of the page is parsed
+CONTAINER = SoupStrainer("main")
 
-class MiddenDrentheAfval(object):
-    def get_date_from_afvaltype(self, ophaaldata, afvaltype, afvalnaam):
+
+class MiddenDrentheAfval(CookieSessionAfval):
+    async def async_start_session(self, session, postcode, street_number):
+        # first call to save cookie
+        await session.request("GET", SENSOR_LOCATIONS_TO_URL["middendrenthe"][0])
+
+    async def async_get_page(self, session, postcode, street_number):
+        data = {
+            "mPostcode": postcode,
+            "mHuisnr": street_number,
+            "mBpk": "WFN"
+        }
+
+        # sending post request and read the data
+        return await session.post_text(SENSOR_LOCATIONS_TO_URL["middendrenthe"][1], data=data)
+
+    def is_session_page(self, page):
+        # without a session there are no containers
+        return "container:" in page
+
+    def get_dates_from_afvaltype(self, ophaaldata, afvaltype, afvalnaam):
+        dates = []
         try:
             today = date.today()
             for data in ophaaldata:
                 result = data.find("h2").string
                 if result.strip() == afvaltype:
-                    dates = re.findall(r'[\w]+[\W]+[\d]+ [\w]+ [\d]+', str(data))
-                    for dateString in dates:
+                    dateStrings = re.findall(r'[\w]+[\W]+[\d]+ [\w]+ [\d]+', str(data))
+                    for dateString in dateStrings:
                         dateString = dateString.split("\n")[1]
                         day = dateString.split()[0]
                         month = MONTH_TO_NUMBER[dateString.split()[1]]
@@ -29,45 +51,24 @@ class MiddenDrentheAfval(object):
                         foundDate = date(int(year), int(month), int(day))
 
                         if foundDate >= today:
-                            return year + "-" + month + "-" + day
-            return ""
+                            dates.append(year + "-" + month + "-" + day)
+            # all the dates from today
+            return dates
         except Exception as exc:
+            # keep the dates that were found before the error
+            if dates:
+                return dates
             _LOGGER.warning("Something went wrong while splitting data: %r. This probably means that trash type %r is not supported on your location", exc, afvalnaam)
             return ""
 
-    def get_data(self, city, postcode, street_number, resources):
+    async def async_get_data(self, client, city, postcode, street_number, resources):
         _LOGGER.debug("Updating Waste collection dates")
 
         try:
-            # Storing cookies in cj variable
-            cj = http.cookiejar.CookieJar()
-
-            # Defining a handler for later http operations with cookies(cj).
-            op = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(cj))
-
-            # first call to save cookie
-            url = SENSOR_LOCATIONS_TO_URL["middendrenthe"][0]
-            res = op.open(url)
-
-            url = SENSOR_LOCATIONS_TO_URL["middendrenthe"][1]
-
-            data = {
-                "mPostcode": postcode,
-                "mHuisnr": street_number,
-                "mBpk": "WFN"
-            }
-
-            postdata = urllib.parse.urlencode(data).encode()
-
-            # sending post request and saving response as response object
-            request = urllib.request.Request(url, postdata)
-            #open the response object
-            response = op.open(request)
-
-            #read the data
-            html = response.read().decode("utf-8")
+            # Client with the cookie jar of this address, the first call is only needed for a new session
+            html = await self.async_get_session_page(client, postcode, street_number)
 
-            soup = BeautifulSoup(html, "html.parser")
+            soup = make_soup(html, CONTAINER)
             ophaaldata = soup.find("main")
             ophaaldata = ophaaldata.find_all("div", {"style": ["width:32%;float:left;", "width:32%;float:right;"]})
 
@@ -75,15 +76,15 @@ class MiddenDrentheAfval(object):
             waste_dict = {}
             # gft
             if "gft" in resources:
-                waste_dict["gft"] = self.get_date_from_afvaltype(ophaaldata, "Groene container:", "gft")
+                waste_dict["gft"] = self.get_dates_from_afvaltype(ophaaldata, "Groene container:", "gft")
             # restafval
             if "restafval" in resources:
-                waste_dict["restafval"] = self.get_date_from_afvaltype(ophaaldata, "Grijze container:", "restafval")
+                waste_dict["restafval"] = self.get_dates_from_afvaltype(ophaaldata, "Grijze container:", "restafval")
             # pbd
             if "pbd" in resources:
-                waste_dict["pbd"] = self.get_date_from_afvaltype(ophaaldata, "Oranje container:", "pbd")
+                waste_dict["pbd"] = self.get_dates_from_afvaltype(ophaaldata, "Oranje container:", "pbd")
 
-            return waste_dict
-        except urllib.error.URLError as exc:
-            _LOGGER.error("Error occurred while fetching data: %r", exc.reason)
+            return CollectionSchedule.from_waste_dict(waste_dict)
+        except aiohttp.ClientError as exc:
+            _LOGGER.error("Error occurred while fetching data: %r", exc)
             return False
@@ -1,204 +1,109 @@
 from ..const.const import (
-    MONTH_TO_NUMBER,
     SENSOR_LOCATIONS_TO_URL,
     _LOGGER,
 )
+from ..schedule import CollectionSchedule
+from ..soup import make_soup
+from .session import CookieSessionAfval
+from bisect import bisect_left
+from datetime import date
 from datetime import datetime
-from datetime import timedelta
-from dateutil.relativedelta import relativedelta
-from bs4 import BeautifulSoup
-import urllib.request
-import urllib.error
-import http.cookiejar
+from bs4 import SoupStrainer
+import aiohttp
+import heapq
 import json
-import ast
 
-
-class OmrinAfval(object):
-    def get_date_from_afvaltype(self, year, data, afvaltype, afvalnaam):
-        try:
-            #to lowercase the data json
-            data = ast.literal_eval(str(data).lower())
-            #to lowercase the afvaltype
-            afvaltype = afvaltype.lower()
-
-            for d in data:
-                # d can contain something like 'biobak1' or 'biobak extra data2'
-                if d.startswith(afvaltype):
-                    dataFilteredByType = data[d]
-                    break
-
-            dates = dataFilteredByType["dates"]
-
-            thisMonth = datetime.today().month
-            thisDay = datetime.today().day
-
-            #for next year, start searching from month 1, day 1
-            if year > datetime.today().year:
-                for month in range(1, 13):
-                    for day in range(1, 32):
-                        res = dates["%s" % month]
-                        if '{:02d}'.format(day) in res:
-                            return str(year) + "-" + '{:02d}'.format(month) + "-" + '{:02d}'.format(day)
-            else:
-                for month in range(thisMonth, 13):
-                    #this month start searching from the current day
-                    if month == thisMonth:
-                        for day in range(thisDay, 32):
-                            res = dates["%s" % month]
-                            if '{:02d}'.format(day) in res:
-                                return str(year) + "-" + '{:02d}'.format(month) + "-" + '{:02d}'.format(day)
-                    #next month start searching from day 1
-                    else:
-                        for day in range(1, 32):
-                            res = dates["%s" % month]
-                            if '{:02d}'.format(day) in res:
-                                return str(year) + "-" + '{:02d}'.format(month) + "-" + '{:02d}'.format(day)
-        except Exception as exc:
-            _LOGGER.warning("Something went wrong while splitting data: %r. This probably means that trash type %r is not supported on your location", exc, afvalnaam)
-            return ""
-
-    def get_data(self, city, postcode, street_number, resources):
+# Only this part of the page is parsed
+CONTAINER = SoupStrainer("div", {"id": "frame"})
+
+# trash type -> the omrin groups to use, the first one with a date wins
+# groups in the same tuple are merged, some locations have an 'Extra' pickup date in another group
+OMRIN_GROUPS = {
+    "restafval": [("sortibak",), ("restafval",), ("rest weststellingwerf",)],
+    "gft": [("gft afval",), ("gft weststellingwerf",), ("tuinafval", "extra tuinafval"), ("biobak", "biobak extra data")],
+    "papier": [("oud papier en karton..",), ("oud papier en karton",)],
+    "textiel": [("textiel",)],
+}
+
+
+class OmrinAfval(CookieSessionAfval):
+    async def async_start_session(self, session, postcode, street_number):
+        # first call to save cookie, the session remembers the address
+        data = {
+            "zipcode": postcode[:4],
+            "zipcodeend": postcode[4:],
+            "housenumber": street_number,
+            "addition": "",
+            "send": "Mijn overzicht",
+        }
+
+        # sending post request
+        await session.request("POST", SENSOR_LOCATIONS_TO_URL["omrin"][0], data=data)
+
+    async def async_get_page(self, session, postcode, street_number):
+        # make a second call with the retrieved cookie and read the data
+        return await session.get_text(SENSOR_LOCATIONS_TO_URL["omrin"][0])
+
+    def is_session_page(self, page):
+        # without a session there are no omrinDataGroups
+        return "omrinDataGroups" in page
+
+    def get_dates_by_group(self, omrinDataGroupsJson, years):
+        # {"2020": {"Biobak1": {"dates": {"1": ["07", "21"], ...}}, "Biobak extra data2": ...}, "2021": ...}
+        # -> {"biobak": [date, ...], "biobak extra data": [date, ...]} with the dates of all years sorted
+        groups = {}
+        for year in years:
+            for name, group in omrinDataGroupsJson.get(str(year), {}).items():
+                dates = groups.setdefault(name.lower().rstrip("0123456789"), [])
+                for month, days in group["dates"].items():
+                    dates.extend(date(year, int(month), int(day)) for day in days)
+        for dates in groups.values():
+            dates.sort()
+        return groups
+
+    def find_group(self, groups, name):
+        if name in groups:
+            return groups[name]
+        # a group name can have more after it, like 'oud papier en karton' for 'Oud papier en karton..4'
+        for group in groups:
+            if group.startswith(name):
+                return groups[group]
+        return []
+
+    def get_dates_from_afvaltype(self, groups, afvalnaam):
+        # all dates from today of the first groups with any
+        today = datetime.today().date()
+        for names in OMRIN_GROUPS[afvalnaam]:
+            dates = list(heapq.merge(*(self.find_group(groups, name) for name in names)))
+            dates = dates[bisect_left(dates, today):]
+            if dates:
+                return dates
+        _LOGGER.warning("No dates found. This probably means that trash type %r is not supported on your location", afvalnaam)
+        return []
+
+    async def async_get_data(self, client, city, postcode, street_number, resources):
         _LOGGER.debug("Updating Waste collection dates")
 
         try:
-            # Storing cookies in cj variable
-            cj = http.cookiejar.CookieJar()
-
-            # Defining a handler for later http operations with cookies(cj).
-            op = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(cj))
-
-            # first call to save cookie
-            url = SENSOR_LOCATIONS_TO_URL["omrin"][0]
-
-            data = {
-                "zipcode": postcode[:4],
-                "zipcodeend": postcode[4:],
-                "housenumber": street_number,
-                "addition": "",
-                "send": "Mijn overzicht",
-            }
-
-            postdata = urllib.parse.urlencode(data).encode()
+            # Client with the cookie jar of this address, the first call is only needed for a new session
+            html = await self.async_get_session_page(client, postcode, street_number)
 
-            # sending post request and saving response as response object
-            request = urllib.request.Request(url, postdata)
-            #open the response object
-            response = op.open(request)
-
-            #make a second call with the just retrieved cookie
-            response = op.open(url)
-
-            #read the data
-            html = response.read().decode("utf-8")
-
-            soup = BeautifulSoup(html, "html.parser")
+            soup = make_soup(html, CONTAINER)
             frame = soup.find("div", {"id": "frame"})
             script = frame.find("script", {"type": "text/javascript"}).string
             omrinDataGroups = script[script.index("{"):]
             omrinDataGroupsJson = json.loads(omrinDataGroups[:len(omrinDataGroups) - 1])
 
+            thisYear = datetime.today().year
+            groups = self.get_dates_by_group(omrinDataGroupsJson, (thisYear, thisYear + 1))
+
             # Place all possible values in the dictionary even if they are not necessary
             waste_dict = {}
+            for afvalnaam in OMRIN_GROUPS:
+                if afvalnaam in resources:
+                    waste_dict[afvalnaam] = self.get_dates_from_afvaltype(groups, afvalnaam)
 
-            thisYear = datetime.today().year
-            nextYear = (datetime.today() + relativedelta(years=1)).year
-
-            omrinThisYear = omrinDataGroupsJson["%s" % thisYear]
-
-            try:
-                omrinNextYear = omrinDataGroupsJson["%s" % nextYear]
-            except KeyError:
-                omrinNextYear = None
-
-            #restafval = Sortibak or Restafval or Rest Weststellingwerf
-            if "restafval" in resources:
-                waste_dict["restafval"] = self.get_date_from_afvaltype(thisYear, omrinThisYear, "Sortibak", "restafval")
-                if omrinNextYear and len(waste_dict["restafval"]) == 0:
-                    waste_dict["restafval"] = self.get_date_from_afvaltype(nextYear, omrinNextYear, "Sortibak", "restafval")
-                if len(waste_dict["restafval"]) == 0:
-                    waste_dict["restafval"] = self.get_date_from_afvaltype(thisYear, omrinThisYear, "Restafval", "restafval")
-                if omrinNextYear and len(waste_dict["restafval"]) == 0:
-                    waste_dict["restafval"] = self.get_date_from_afvaltype(nextYear, omrinNextYear, "Restafval", "restafval")
-                if len(waste_dict["restafval"]) == 0:
-                    waste_dict["restafval"] = self.get_date_from_afvaltype(thisYear, omrinThisYear, "Rest Weststellingwerf", "restafval")
-                if omrinNextYear and len(waste_dict["restafval"]) == 0:
-                    waste_dict["restafval"] = self.get_date_from_afvaltype(nextYear, omrinNextYear, "Rest Weststellingwerf", "restafval")
-            #gft = Biobak or Tuinafval or Extra Tuinafval or GFT afval or GFT Weststellingwerf
-            #Biobak
-            if "gft" in resources:
-
-                #GFT afval
-                waste_dict["gft"] = self.get_date_from_afvaltype(thisYear, omrinThisYear, "GFT afval", "gft")
-                if omrinNextYear and len(waste_dict["gft"]) == 0:
-                    waste_dict["gft"] = self.get_date_from_afvaltype(nextYear, omrinNextYear, "GFT afval", "gft")
-                #GFT Weststellingwerf
-                if len(waste_dict["gft"]) == 0:
-                    waste_dict["gft"] = self.get_date_from_afvaltype(thisYear, omrinThisYear, "GFT Weststellingwerf", "gft")
-                if omrinNextYear and len(waste_dict["gft"]) == 0:
-                    waste_dict["gft"] = self.get_date_from_afvaltype(nextYear, omrinNextYear, "GFT Weststellingwerf", "gft")
-                #For certain locations there is an 'Extra' pickup date... see which one is earlier
-                if len(waste_dict["gft"]) == 0:
-                    if len(waste_dict["gft"]) == 0:
-                        tuinafval = self.get_date_from_afvaltype(thisYear, omrinThisYear, "Tuinafval", "gft")
-                    if omrinNextYear and len(tuinafval) == 0:
-                        tuinafval = self.get_date_from_afvaltype(nextYear, omrinNextYear, "Tuinafval", "gft")
-                    if len(waste_dict["gft"]) == 0:
-                        extratuinafval = self.get_date_from_afvaltype(thisYear, omrinThisYear, "Extra Tuinafval", "gft")
-                    if omrinNextYear and len(extratuinafval) == 0:
-                        extratuinafval = self.get_date_from_afvaltype(nextYear, omrinNextYear, "Extra Tuinafval", "gft")
-
-                    if len(tuinafval) != 0 or len(extratuinafval) != 0:
-                        if len(tuinafval) != 0 and len(extratuinafval) == 0:
-                            waste_dict["gft"] = tuinafval
-                        if len(tuinafval) == 0 and len(extratuinafval) != 0:
-                            waste_dict["gft"] = extratuinafval
-                        if len(tuinafval) != 0 and len(extratuinafval) != 0:
-                            if tuinafval < extratuinafval:
-                                waste_dict["gft"] = tuinafval
-                            if extratuinafval < tuinafval:
-                                waste_dict["gft"] = extratuinafval
-                #For certain locations there is an 'Extra' pickup date... see which one is earlier
-                if len(waste_dict["gft"]) == 0:
-                    if len(waste_dict["gft"]) == 0:
-                        tuinafval = self.get_date_from_afvaltype(thisYear, omrinThisYear, "Biobak", "gft")
-                    if omrinNextYear and len(tuinafval) == 0:
-                        tuinafval = self.get_date_from_afvaltype(nextYear, omrinNextYear, "Biobak", "gft")
-                    if len(waste_dict["gft"]) == 0:
-                        extratuinafval = self.get_date_from_afvaltype(thisYear, omrinThisYear, "Biobak extra data", "gft")
-                    if omrinNextYear and len(extratuinafval) == 0:
-                        extratuinafval = self.get_date_from_afvaltype(nextYear, omrinNextYear, "Biobak extra data", "gft")
-
-                    if len(tuinafval) != 0 or len(extratuinafval) != 0:
-                        if len(tuinafval) != 0 and len(extratuinafval) == 0:
-                            waste_dict["gft"] = tuinafval
-                        if len(tuinafval) == 0 and len(extratuinafval) != 0:
-                            waste_dict["gft"] = extratuinafval
-                        if len(tuinafval) != 0 and len(extratuinafval) != 0:
-                            if tuinafval < extratuinafval:
-                                waste_dict["gft"] = tuinafval
-                            if extratuinafval < tuinafval:
-                                waste_dict["gft"] = extratuinafval
-
-
-            #papier = Oud papier en karton.. or Oud papier en karton
-            if "papier" in resources:
-                waste_dict["papier"] = self.get_date_from_afvaltype(thisYear, omrinThisYear, "Oud papier en karton..", "papier")
-                if omrinNextYear and len(waste_dict["papier"]) == 0:
-                    waste_dict["papier"] = self.get_date_from_afvaltype(nextYear, omrinNextYear, "Oud papier en karton..", "papier")
-                if len(waste_dict["papier"]) == 0:
-                    waste_dict["papier"] = self.get_date_from_afvaltype(thisYear, omrinThisYear, "Oud papier en karton", "papier")
-                if omrinNextYear and len(waste_dict["papier"]) == 0:
-                    waste_dict["papier"] = self.get_date_from_afvaltype(nextYear, omrinNextYear, "Oud papier en karton", "papier")
-
-                _LOGGER.warning(waste_dict["papier"])
-            #textiel = textiel
-            if "textiel" in resources:
-                waste_dict["textiel"] = self.get_date_from_afvaltype(thisYear, omrinThisYear, "Textiel", "textiel")
-                if omrinNextYear and len(waste_dict["textiel"]) == 0:
-                    waste_dict["textiel"] = self.get_date_from_afvaltype(nextYear, omrinNextYear, "Textiel", "textiel")
-
-            return waste_dict
-        except urllib.error.URLError as exc:
-            _LOGGER.error("Error occurred while fetching data: %r", exc.reason)
+            return CollectionSchedule.from_waste_dict(waste_dict)
+        except aiohttp.ClientError as exc:
+            _LOGGER.error("Error occurred while fetching data: %r", exc)
             return False
\ No newline at end of file
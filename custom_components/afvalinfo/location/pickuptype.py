@@ -0,0 +1,42 @@
+class PickupTypes(object):
+    """The dates of a Ximmio style calendar per trash type, see XIMMIO_PICKUP_TYPES.
+
+    The table maps the pickup type of a calendar item to the trash types it is for, each with
+    a priority, 0 is the best. A trash type gets the dates of the best pickup type that has any,
+    whatever the order of the items in the calendar.
+    """
+
+    def __init__(self, field, table):
+        self._field = field
+        self._table = table
+
+    def get_afvalnamen(self, resources):
+        # the trash types of resources that a pickup type is for
+        afvalnamen = {afvalnaam for afvaltypes in self._table.values() for afvalnaam, _ in afvaltypes}
+        return [resource for resource in resources if resource in afvalnamen]
+
+    def get_dates(self, data):
+        # all the pickup dates, without the time
+        return [pickupDate.split("T")[0] for pickupDate in data["pickupDates"]]
+
+    def get_waste_dict(self, dataList, resources):
+        best = {}
+        for data in dataList:
+            afvaltypes = self._table.get(data[self._field], ())
+            if not any(afvalnaam in resources for afvalnaam, _ in afvaltypes):
+                continue
+
+            dates = self.get_dates(data)
+            for afvalnaam, priority in afvaltypes:
+                if afvalnaam not in resources:
+                    continue
+                # a pickup type without dates only counts when there is nothing else
+                if not dates:
+                    priority = float("inf")
+                current = best.get(afvalnaam)
+                if current is None or priority < current[0]:
+                    best[afvalnaam] = (priority, dates)
+                elif priority == current[0] and dates:
+                    best[afvalnaam] = (priority, sorted(set(current[1]).union(dates)))
+
+        return {afvalnaam: dates for afvalnaam, (_, dates) in best.items()}
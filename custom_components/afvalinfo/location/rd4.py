@@ -4,32 +4,43 @@ from ..const.const import (
     SENSOR_LOCATIONS_TO_URL,
     _LOGGER,
 )
+from ..schedule import CollectionSchedule
+from ..soup import make_soup
 from datetime import datetime
 from datetime import timedelta
-from bs4 import BeautifulSoup
-import urllib.request
-import urllib.error
+from bs4 import SoupStrainer
+import aiohttp
+
+# Only this part of the page is parsed
+CONTAINER = SoupStrainer(id="Afvalkalender1_pnlAfvalKalender")
+
 
 class Rd4Afval(object):
-    def get_date_from_afvaltype(self, data, afvaltype, afvalnaam):
+    def get_days_by_month(self, ophaaldata):
+        # the text and the markup of every <td> of every month in lower case, a date is in the text
+        # of the <td> before its trash type. The trash type is looked up in the markup, it can be
+        # in an attribute like the alt of an image instead of in the text
+        return [
+            [(td.get_text().lower(), str(td).lower()) for td in month.find_all("td")]
+            for month in ophaaldata.find_all("table", {"class": "plaintextMonth"})
+        ]
+
+    def get_date_from_afvaltype(self, months, afvaltype, afvalnaam):
         try:
             afvaltype = afvaltype.lower()
             thisMonth = datetime.today().month
+            date = None
 
             if datetime.today().month <= 11:
                 nextMonth = datetime.today().month + 1
             else:
                 nextMonth = 1
 
-            data = BeautifulSoup(str(data).lower(), "html.parser")
-            html = data.find_all("table", {"class": "plaintextmonth"})
-
-            htmlThisMonth = html[thisMonth - 1]
-            tdsThisMonth = htmlThisMonth.find_all("td")
+            tdsThisMonth = months[thisMonth - 1]
 
-            for index, td in enumerate(tdsThisMonth):
-                if str(td).find(afvaltype) != -1:
-                    date = tdsThisMonth[index - 1].string
+            for index, (_, markup) in enumerate(tdsThisMonth):
+                if markup.find(afvaltype) != -1:
+                    date = tdsThisMonth[index - 1][0]
                     day = int(date.split()[1])
                     #if today is later than the found date, erase the date and day
                     if datetime.today().day > day:
@@ -42,12 +53,11 @@ class Rd4Afval(object):
             #If no valid date for this month is found, check next monthToNumber
             #But not when the next month is next year
             if date is None and nextMonth != 1:
-                htmlNextMonth = html[nextMonth - 1]
-                tdsNextMonth = htmlNextMonth.find_all("td")
-                for index, td in enumerate(tdsNextMonth):
-                    if str(td).find(afvaltype) != -1:
+                tdsNextMonth = months[nextMonth - 1]
+                for index, (_, markup) in enumerate(tdsNextMonth):
+                    if markup.find(afvaltype) != -1:
                         #valid date found
-                        date = tdsNextMonth[index - 1].string
+                        date = tdsNextMonth[index - 1][0]
                         break
 
             day = date.split()[1]
@@ -58,19 +68,18 @@ class Rd4Afval(object):
             _LOGGER.warning("Something went wrong while splitting data: %r. This probably means that trash type %r is not supported on your location", exc, afvalnaam)
             return ""
 
-    def get_data(self, city, postcode, street_number, resources):
+    async def async_get_data(self, client, city, postcode, street_number, resources):
         _LOGGER.debug("Updating Waste collection dates")
 
         try:
             url = SENSOR_LOCATIONS_TO_URL["rd4"][0].format(
                 postcode, street_number
             )
-            req = urllib.request.Request(url=url)
-            f = urllib.request.urlopen(req)
-            html = f.read().decode("utf-8")
+            html = await client.get_text(url)
 
-            soup = BeautifulSoup(html, "html.parser")
+            soup = make_soup(html, CONTAINER)
             ophaaldata = soup.find(id="Afvalkalender1_pnlAfvalKalender")
+            months = self.get_days_by_month(ophaaldata)
 
             #ToDo: Check calendar for the next year...
             #need to send _VIEWSTATE and that kind of stuff
@@ -78,17 +87,17 @@ class Rd4Afval(object):
             # Place all possible values in the dictionary even if they are not necessary
             waste_dict = {}
             if "gft" in resources:
-                waste_dict["gft"] = self.get_date_from_afvaltype(ophaaldata, "GFT", "gft")
+                waste_dict["gft"] = self.get_date_from_afvaltype(months, "GFT", "gft")
             if "textiel" in resources:
-                waste_dict["textiel"] = self.get_date_from_afvaltype(ophaaldata, "BEST-tas", "textiel")
+                waste_dict["textiel"] = self.get_date_from_afvaltype(months, "BEST-tas", "textiel")
             if "papier" in resources:
-                waste_dict["papier"] = self.get_date_from_afvaltype(ophaaldata, "Oud papier", "papier")
+                waste_dict["papier"] = self.get_date_from_afvaltype(months, "Oud papier", "papier")
             if "pbd" in resources:
-                waste_dict["pbd"] = self.get_date_from_afvaltype(ophaaldata, "PMD-afval", "pbd")
+                waste_dict["pbd"] = self.get_date_from_afvaltype(months, "PMD-afval", "pbd")
             if "restafval" in resources:
-                waste_dict["restafval"] = self.get_date_from_afvaltype(ophaaldata, "Restafval", "restafval")
+                waste_dict["restafval"] = self.get_date_from_afvaltype(months, "Restafval", "restafval")
 
-            return waste_dict
-        except urllib.error.URLError as exc:
-            _LOGGER.error("Error occurred while fetching data: %r", exc.reason)
+            return CollectionSchedule.from_waste_dict(waste_dict)
+        except aiohttp.ClientError as exc:
+            _LOGGER.error("Error occurred while fetching data: %r", exc)
             return False
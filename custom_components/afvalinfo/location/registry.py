@@ -0,0 +1,79 @@
+from types import MappingProxyType
+import importlib
+
+from ..const.const import (
+    PARTIAL_GEMEENTEN,
+    SENSOR_LOCATIONS_TO_GEMEENTEN,
+)
+
+# location -> (module, class) that collects the waste dates for that location
+# The module is only imported when a configured gemeente needs it
+SENSOR_LOCATIONS_TO_PROVIDER = MappingProxyType({
+    "afvalstoffendienstkalender": ("afvalstoffendienstkalender", "AfvalstoffendienstkalenderAfval"),
+    "alkmaar": ("afvalstroom", "AfvalstroomAfval"),
+    "alphenaandenrijn": ("afvalstroom", "AfvalstroomAfval"),
+    "avalex": ("avalex", "AvalexAfval"),
+    "beesel": ("beesel", "BeeselAfval"),
+    "berkelland": ("afvalstroom", "AfvalstroomAfval"),
+    "blink": ("afvalstroom", "AfvalstroomAfval"),
+    "borsele": ("borsele", "BorseleAfval"),
+    "circulusberkel": ("afvalstroom", "AfvalstroomAfval"),
+    "cranendonck": ("afvalstroom", "AfvalstroomAfval"),
+    "cyclus": ("afvalstroom", "AfvalstroomAfval"),
+    "dar": ("afvalstroom", "AfvalstroomAfval"),
+    "deafvalapp": ("deafvalapp", "DeAfvalAppAfval"),
+    "defriesemeren": ("defriesemeren", "DeFrieseMerenAfval"),
+    "denhaag": ("denhaag", "DenHaagAfval"),
+    "drimmelen": ("drimmelen", "DrimmelenAfval"),
+    "gad": ("afvalstroom", "AfvalstroomAfval"),
+    "goereeoverflakkee": ("goereeoverflakkee", "GoereeOverflakkeeAfval"),
+    "groningen": ("groningen", "GroningenAfval"),
+    "hoekschewaard": ("hoekschewaard", "HoekscheWaardAfval"),
+    "hvc": ("hvc", "HvcAfval"),
+    "irado": ("irado", "IradoAfval"),
+    "katwijk": ("katwijk", "KatwijkAfval"),
+    "middendrenthe": ("middendrenthe", "MiddenDrentheAfval"),
+    "mijnafvalwijzer": ("mijnafvalwijzer", "MijnAfvalWijzerAfval"),
+    "omrin": ("omrin", "OmrinAfval"),
+    "peelenmaas": ("afvalstroom", "AfvalstroomAfval"),
+    "purmerend": ("afvalstroom", "AfvalstroomAfval"),
+    "rd4": ("rd4", "Rd4Afval"),
+    "rmn": ("afvalstroom", "AfvalstroomAfval"),
+    "rova": ("rova", "RovaAfval"),
+    "schouwenduiveland": ("afvalstroom", "AfvalstroomAfval"),
+    "sliedrecht": ("afvalstroom", "AfvalstroomAfval"),
+    "spaarnelanden": ("afvalstroom", "AfvalstroomAfval"),
+    "suez": ("afvalstroom", "AfvalstroomAfval"),
+    "uden": ("uden", "UdenAfval"),
+    "veldhoven": ("veldhoven", "VeldhovenAfval"),
+    "venlo": ("venlo", "VenloAfval"),
+    "venray": ("afvalstroom", "AfvalstroomAfval"),
+    "waalre": ("waalre", "WaalreAfval"),
+    "westerkwartier": ("westerkwartier", "WesterkwartierAfval"),
+    "westerwolde": ("westerwolde", "WesterwoldeAfval"),
+    "westland": ("westland", "WestlandAfval"),
+    "ximmio": ("ximmio", "XimmioAfval"),
+    "zrd": ("afvalstroom", "AfvalstroomAfval"),
+    "zuidwestfriesland": ("afvalstroom", "AfvalstroomAfval")
+})
+
+# gemeente -> location
+GEMEENTE_TO_LOCATION = MappingProxyType({
+    gemeente: location
+    for location, gemeenten in SENSOR_LOCATIONS_TO_GEMEENTEN.items()
+    for gemeente in gemeenten
+})
+
+_LOADED_PROVIDERS = {}
+
+
+def get_provider(gemeente):
+    location = GEMEENTE_TO_LOCATION[gemeente]
+    if location not in _LOADED_PROVIDERS:
+        module, name = SENSOR_LOCATIONS_TO_PROVIDER[location]
+        _LOADED_PROVIDERS[location] = getattr(importlib.import_module("." + module, __package__), name)
+    return _LOADED_PROVIDERS[location]
+
+
+def supported_gemeenten_count():
+    return sum(PARTIAL_GEMEENTEN.get(gemeente, 1) for gemeente in GEMEENTE_TO_LOCATION)
@@ -1,46 +1,21 @@
 from ..const.const import (
     SENSOR_LOCATIONS_TO_URL,
-    MONTH_TO_NUMBER,
     _LOGGER,
 )
+from ..schedule import CollectionSchedule
+from ..soup import make_soup
+from .jaaroverzicht import Jaaroverzicht
 from datetime import datetime
 from datetime import date
-from bs4 import BeautifulSoup
-import urllib.request
-import urllib.error
-import requests
+from bs4 import SoupStrainer
+import aiohttp
 
+# Only this part of the page is parsed
+CONTAINER = SoupStrainer("div", {"class": "ophaaldagen"})
 
-class RovaAfval(object):
-    def get_date_from_afvaltype(self, html, afvaltype, afvalnaam):
-        try:
-            results = html.findAll("p", {"class": afvaltype})
-
-            for result in results:
-                date = result.find("span", {"class": "span-line-break"})
-
-                # get the value of the span
-                date = date.string
 
-                day = date.split()[1]
-                month = MONTH_TO_NUMBER[date.split()[2]]
-                # the year is always this year because it's a 'jaaroverzicht'
-                year = datetime.today().year
-
-                if int(month) >= datetime.today().month:
-                    if int(month) == datetime.today().month:
-                        if int(day) >= datetime.today().day:
-                            return str(year) + "-" + str(month) + "-" + str(day)
-                    else:
-                        return str(year) + "-" + str(month) + "-" + str(day)
-
-            # if nothing was found
-            return ""
-        except Exception as exc:
-            _LOGGER.warning("Something went wrong while splitting data: %r. This probably means that trash type %r is not supported on your location", exc, afvalnaam)
-            return ""
-
-    def get_data(self, city, postcode, street_number, resources):
+class RovaAfval(object):
+    async def async_get_data(self, client, city, postcode, street_number, resources):
         _LOGGER.debug("Updating Waste collection dates")
 
         try:
@@ -48,36 +23,32 @@ class RovaAfval(object):
                 postcode, street_number
             )
 
-            req = urllib.request.Request(url=url)
-            f = urllib.request.urlopen(req)
-            html = f.read().decode("utf-8")
+            html = await client.get_text(url)
 
-            soup = BeautifulSoup(html, "html.parser")
+            soup = make_soup(html, CONTAINER)
 
-            res = soup.find("div", {"class": "ophaaldagen"})
+            res = Jaaroverzicht(soup.find("div", {"class": "ophaaldagen"}), datetime.today().date())
 
             # Place all possible values in the dictionary even if they are not necessary"""
             waste_dict = {}
 
             # find gft
             if "gft" in resources:
-                waste_dict["gft"] = self.get_date_from_afvaltype(res, "gft", "gft")
+                waste_dict["gft"] = res.get_dates_from_afvaltype(("gft",), "gft")
             # find restafval
             if "restafval" in resources:
-                waste_dict["restafval"] = self.get_date_from_afvaltype(res, "restafval", "restafval")
+                waste_dict["restafval"] = res.get_dates_from_afvaltype(("restafval",), "restafval")
             # find pbd. In some locations it's 'pd' and in other locations it's 'pmb'
             if "pbd" in resources:
-                waste_dict["pbd"] = self.get_date_from_afvaltype(res, "pd", "pbd")
-                if len(waste_dict["pbd"]) == 0:
-                    waste_dict["pbd"] = self.get_date_from_afvaltype(res, "pmd", "pbd")
+                waste_dict["pbd"] = res.get_dates_from_afvaltype(("pd", "pmd"), "pbd")
             # find papier
             if "papier" in resources:
-                waste_dict["papier"] = self.get_date_from_afvaltype(res, "papier", "papier")
+                waste_dict["papier"] = res.get_dates_from_afvaltype(("papier",), "papier")
             # find textiel
             if "textiel" in resources:
-                waste_dict["textiel"] = self.get_date_from_afvaltype(res, "textiel", "textiel")
+                waste_dict["textiel"] = res.get_dates_from_afvaltype(("textiel",), "textiel")
 
-            return waste_dict
-        except urllib.error.URLError as exc:
-            _LOGGER.error("Error occurred while fetching data: %r", exc.reason)
+            return CollectionSchedule.from_waste_dict(waste_dict)
+        except aiohttp.ClientError as exc:
+            _LOGGER.error("Error occurred while fetching data: %r", exc)
             return False
@@ -0,0 +1,46 @@
+from ..const.const import _LOGGER
+import aiohttp
+
+
+class CookieSessionAfval(object):
+    """Base for the locations which need a session cookie to get the page with the dates.
+
+    The cookie jar is kept in cookie_jar, the provider exists once per address, so the next
+    refresh only needs the page itself. When the location doesn't accept the session anymore
+    a new one is started and the page is asked again.
+    """
+
+    cookie_jar = None
+
+    async def async_start_session(self, session, postcode, street_number):
+        """The requests that give the session cookie, before the page can be asked."""
+        pass
+
+    async def async_get_page(self, session, postcode, street_number):
+        """The page with the dates."""
+        raise NotImplementedError
+
+    def is_session_page(self, page):
+        """False when the location didn't accept the session and gave another page."""
+        return True
+
+    async def async_get_session_page(self, client, postcode, street_number):
+        if self.cookie_jar is not None:
+            async with client.cookie_session(cookie_jar=self.cookie_jar) as session:
+                try:
+                    page = await self.async_get_page(session, postcode, street_number)
+                    if self.is_session_page(page):
+                        return page
+                except aiohttp.ClientResponseError as exc:
+                    if exc.status not in (401, 403):
+                        raise
+            _LOGGER.debug("Session for %s %s not accepted, starting a new one", postcode, street_number)
+            self.cookie_jar = None
+
+        # Only keep the cookie jar when the whole handshake succeeded
+        cookie_jar = aiohttp.CookieJar()
+        async with client.cookie_session(cookie_jar=cookie_jar) as session:
+            await self.async_start_session(session, postcode, street_number)
+            page = await self.async_get_page(session, postcode, street_number)
+        self.cookie_jar = cookie_jar
+        return page
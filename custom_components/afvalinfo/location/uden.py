@@ -3,15 +3,18 @@ from ..const.const import (
     SENSOR_LOCATIONS_TO_URL,
     _LOGGER,
 )
+from ..schedule import CollectionSchedule
+from ..soup import make_soup
 from datetime import datetime
 from datetime import timedelta
 from dateutil.relativedelta import relativedelta
-from bs4 import BeautifulSoup
-import urllib.request
-import urllib.error
-import http.cookiejar
+from bs4 import SoupStrainer
+import aiohttp
 import json
 
+# Only this part of the page is parsed
+CONTAINER = SoupStrainer("div", {"id": "content"})
+
 
 class UdenAfval(object):
     def get_date_from_afvaltype(self, ophaaldata, afvaltype, afvalnaam):
@@ -37,18 +40,16 @@ class UdenAfval(object):
             return ""
 
 
-    def get_data(self, city, postcode, street_number, resources):
+    async def async_get_data(self, client, city, postcode, street_number, resources):
         _LOGGER.debug("Updating Waste collection dates")
 
         try:
             url = SENSOR_LOCATIONS_TO_URL[city][0].format(
                 postcode, street_number
             )
-            req = urllib.request.Request(url=url)
-            f = urllib.request.urlopen(req)
-            html = f.read().decode("utf-8")
+            html = await client.get_text(url)
 
-            soup = BeautifulSoup(html, "html.parser")
+            soup = make_soup(html, CONTAINER)
 
             mainDiv = soup.find("div", {"id": ['content']})
 
@@ -68,7 +69,7 @@ class UdenAfval(object):
             if "gft" in resources:
                 waste_dict["gft"] = self.get_date_from_afvaltype(tr, "gft", "gft")
 
-            return waste_dict
-        except urllib.error.URLError as exc:
-            _LOGGER.error("Error occurred while fetching data: %r", exc.reason)
+            return CollectionSchedule.from_waste_dict(waste_dict)
+        except aiohttp.ClientError as exc:
+            _LOGGER.error("Error occurred while fetching data: %r", exc)
             return False
\ No newline at end of file
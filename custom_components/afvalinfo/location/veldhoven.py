@@ -3,24 +3,30 @@ from ..const.const import (
     SENSOR_LOCATIONS_TO_URL,
     _LOGGER,
 )
+from ..schedule import CollectionSchedule
+from ..soup import make_soup
 from datetime import datetime
 from datetime import timedelta
-from bs4 import BeautifulSoup
-import urllib.request
-import urllib.error
+from bs4 import SoupStrainer
+import aiohttp
+
+# Only this part of the page is parsed
+CONTAINER = SoupStrainer("table", {"id": "garbage-dates"})
 
 
 class VeldhovenAfval(object):
-    def get_date_from_afvaltype(self, ophaaldata, afvaltype, afvalnaam):
-        try:
-            # get index of the <h3> element, which is just before our <td> element with the date
-            searchString = "id=\"" + afvaltype + "\">"
-            i = str(ophaaldata).index(searchString) + len(searchString)
+    def get_dates_by_afvaltype(self, ophaaldata):
+        # the <h3> element has the trash type as id, the <td> element with the dates comes right after it
+        tds = {}
+        for header in ophaaldata.find_all(id=True):
+            if header["id"] not in tds:
+                tds[header["id"]] = header.find_next("td")
+        return tds
 
-            # get the <p> element with the date in it
-            dates = BeautifulSoup(str(ophaaldata)[i:], "html.parser").find(
-                "td"
-            )
+    def get_date_from_afvaltype(self, tds, afvaltype, afvalnaam):
+        try:
+            # get the <td> element with the dates in it
+            dates = tds[afvaltype]
 
             insdate = dates.find("ins")
 
@@ -73,37 +79,35 @@ class VeldhovenAfval(object):
             _LOGGER.warning("Something went wrong while splitting data: %r. This probably means that trash type %r is not supported on your location", exc, afvalnaam)
             return ""
 
-    def get_data(self, city, postcode, street_number, resources):
+    async def async_get_data(self, client, city, postcode, street_number, resources):
         _LOGGER.debug("Updating Waste collection dates")
 
         try:
             url = SENSOR_LOCATIONS_TO_URL["veldhoven"][0].format(
                 postcode, street_number
             )
-            req = urllib.request.Request(url=url)
-            f = urllib.request.urlopen(req)
-            html = f.read().decode("utf-8")
+            html = await client.get_text(url)
 
-            soup = BeautifulSoup(html, "html.parser")
-            ophaaldata = soup.find(id="main")
-            ophaaldata = ophaaldata.find("table", {"id": "garbage-dates"})
+            soup = make_soup(html, CONTAINER)
+            ophaaldata = soup.find("table", {"id": "garbage-dates"})
+            tds = self.get_dates_by_afvaltype(ophaaldata)
 
             # Place all possible values in the dictionary even if they are not necessary
             waste_dict = {}
             # find groene-container = gft
             if "gft" in resources:
-                waste_dict["gft"] = self.get_date_from_afvaltype(ophaaldata, "groene-container", "gft")
+                waste_dict["gft"] = self.get_date_from_afvaltype(tds, "groene-container", "gft")
             # find grijze-container = restafval
             if "restafval" in resources:
-                waste_dict["restafval"] = self.get_date_from_afvaltype(ophaaldata, "grijze-container", "restafval")
+                waste_dict["restafval"] = self.get_date_from_afvaltype(tds, "grijze-container", "restafval")
             # find pmd-zak = pbd
             if "pbd" in resources:
-                waste_dict["pbd"] = self.get_date_from_afvaltype(ophaaldata, "pmd-zak", "pbd")
+                waste_dict["pbd"] = self.get_date_from_afvaltype(tds, "pmd-zak", "pbd")
             # find blauwe-container = papier
             if "papier" in resources:
-                waste_dict["papier"] = self.get_date_from_afvaltype(ophaaldata, "blauwe-container", "papier")
+                waste_dict["papier"] = self.get_date_from_afvaltype(tds, "blauwe-container", "papier")
 
-            return waste_dict
-        except urllib.error.URLError as exc:
-            _LOGGER.error("Error occurred while fetching data: %r", exc.reason)
+            return CollectionSchedule.from_waste_dict(waste_dict)
+        except aiohttp.ClientError as exc:
+            _LOGGER.error("Error occurred while fetching data: %r", exc)
             return False
@@ -3,14 +3,19 @@ from ..const.const import (
     SENSOR_LOCATIONS_TO_URL,
     _LOGGER,
 )
+from ..schedule import CollectionSchedule
+from ..soup import make_soup
 from datetime import datetime, date
-from bs4 import BeautifulSoup
-import urllib.request
-import urllib.error
+from bs4 import SoupStrainer
+import aiohttp
+
+# Only this part of the page is parsed
+CONTAINER = SoupStrainer("div", {"class": "trash-removal-calendar"})
 
 
 class VenloAfval(object):
-    def get_date_from_afvaltype(self, tableRows, afvaltype, afvalnaam):
+    def get_dates_from_afvaltype(self, tableRows, afvaltype, afvalnaam):
+        dates = []
         try:
             for row in tableRows:
                 garbageDate = row.find("td")
@@ -32,25 +37,26 @@ class VenloAfval(object):
                             garbageDate = year + "-" + month + "-" + day
 
                             if datetime.strptime(garbageDate, '%Y-%m-%d').date() >= date.today():
-                                return garbageDate
-            # if nothing was found
-            return ""
+                                dates.append(garbageDate)
+            # all the dates from today
+            return dates
         except Exception as exc:
+            # keep the dates that were found before the error
+            if dates:
+                return dates
             _LOGGER.warning("Something went wrong while splitting data: %r. This probably means that trash type %r is not supported on your location", exc, afvalnaam)
             return ""
 
-    def get_data(self, city, postcode, street_number, resources):
+    async def async_get_data(self, client, city, postcode, street_number, resources):
         _LOGGER.debug("Updating Waste collection dates")
 
         try:
             url = SENSOR_LOCATIONS_TO_URL["venlo"][0].format(
                 postcode, street_number
             )
-            req = urllib.request.Request(url=url)
-            f = urllib.request.urlopen(req)
-            html = f.read().decode("utf-8")
+            html = await client.get_text(url)
 
-            soup = BeautifulSoup(html, "html.parser")
+            soup = make_soup(html, CONTAINER)
 
             html = soup.find("div", {"class": "trash-removal-calendar"})
             tableRows = html.findAll("tr")
@@ -59,18 +65,18 @@ class VenloAfval(object):
             waste_dict = {}
             # GFT
             if "gft" in resources:
-                waste_dict["gft"] = self.get_date_from_afvaltype(tableRows, "GFT", "gft")
+                waste_dict["gft"] = self.get_dates_from_afvaltype(tableRows, "GFT", "gft")
             # Restafval
             if "restafval" in resources:
-                waste_dict["restafval"] = self.get_date_from_afvaltype(tableRows, "Restafval/PMD", "restafval")
+                waste_dict["restafval"] = self.get_dates_from_afvaltype(tableRows, "Restafval/PMD", "restafval")
             # PMD
             if "pbd" in resources:
-                waste_dict["pbd"] = self.get_date_from_afvaltype(tableRows, "Restafval/PMD", "pbd")
+                waste_dict["pbd"] = self.get_dates_from_afvaltype(tableRows, "Restafval/PMD", "pbd")
             # Papier
             if "papier" in resources:
-                waste_dict["papier"] = self.get_date_from_afvaltype(tableRows, "Papier", "papier")
+                waste_dict["papier"] = self.get_dates_from_afvaltype(tableRows, "Papier", "papier")
 
-            return waste_dict
-        except urllib.error.URLError as exc:
-            _LOGGER.error("Error occurred while fetching data: %r", exc.reason)
+            return CollectionSchedule.from_waste_dict(waste_dict)
+        except aiohttp.ClientError as exc:
+            _LOGGER.error("Error occurred while fetching data: %r", exc)
             return False
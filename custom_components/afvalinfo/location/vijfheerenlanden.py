@@ -3,85 +3,81 @@ from ..const.const import (
     SENSOR_LOCATIONS_TO_URL,
     _LOGGER,
 )
+from ..schedule import CollectionSchedule
+from .address import AddressNotFound, CachedAddressAfval
+from .pickuptype import PickupTypes
 
 from datetime import datetime, date
-import urllib.request
-import urllib.error
-import requests
+import aiohttp
 
 from dateutil.relativedelta import relativedelta
 
-
-class VijfheerenlandenAfval(object):
-    def get_data(self, city, postcode, street_number, resources):
+# The trash types of every pickupType with their priority, see XIMMIO_PICKUP_TYPES
+VIJFHEERENLANDEN_PICKUP_TYPES = PickupTypes("pickupType", {
+    0: (("restafval", 0),),
+    1: (("gft", 0),),
+    2: (("papier", 0),),
+    4: (("textiel", 0),),
+    10: (("pbd", 0),),
+})
+
+
+class VijfheerenlandenAfval(CachedAddressAfval):
+    async def async_get_address(self, client, postcode, street_number):
+        #######################################################
+        # First request: get uniqueId and community
+        API_ENDPOINT = SENSOR_LOCATIONS_TO_URL["vijfheerenlanden"][0]
+
+        data = {
+            "postCode": postcode,
+            "houseNumber": street_number,
+            "companyCode": self.companyCode,
+        }
+
+        # sending post request and saving response as response object
+        r = await client.post_json(API_ENDPOINT, data=data)
+
+        # extracting response json
+        return {
+            "uniqueId": r["dataList"][0]["UniqueId"],
+            "community": r["dataList"][0]["Community"],
+        }
+
+    async def async_get_calendar(self, client, address):
+        #######################################################
+        # Second request: get the dates
+        API_ENDPOINT = SENSOR_LOCATIONS_TO_URL["vijfheerenlanden"][1]
+
+        today = date.today()
+        todayNextYear = today + relativedelta(years=1)
+
+        data = {
+            "companyCode": self.companyCode,
+            "startDate": str(today),
+            "endDate": str(todayNextYear),
+            "community": address["community"],
+            "uniqueAddressID": address["uniqueId"],
+        }
+
+        r = await client.post_json(API_ENDPOINT, data=data)
+        # an unknown uniqueId gives no dataList
+        if r.get("dataList") is None:
+            raise AddressNotFound(address)
+        return r["dataList"]
+
+    async def async_get_data(self, client, city, postcode, street_number, resources):
         _LOGGER.debug("Updating Waste collection dates")
 
         try:
-            # Place all possible values in the dictionary even if they are not necessary
-            waste_dict = {}
-
             # Get companyCode for this location
-            companyCode = SENSOR_LOCATIONS_TO_COMPANY_CODE["vijfheerenlanden"]
-
-            #######################################################
-            # First request: get uniqueId and community
-            API_ENDPOINT = SENSOR_LOCATIONS_TO_URL["vijfheerenlanden"][0]
-
-            data = {
-                "postCode": postcode,
-                "houseNumber": street_number,
-                "companyCode": companyCode,
-            }
-
-            # sending post request and saving response as response object
-            r = requests.post(url=API_ENDPOINT, data=data)
-
-            # extracting response json
-            uniqueId = r.json()["dataList"][0]["UniqueId"]
-            community = r.json()["dataList"][0]["Community"]
-
-            #######################################################
-            # Second request: get the dates
-            API_ENDPOINT = SENSOR_LOCATIONS_TO_URL["vijfheerenlanden"][1]
-
-            today = date.today()
-            todayNextYear = today + relativedelta(years=1)
-
-            data = {
-                "companyCode": companyCode,
-                "startDate": today,
-                "endDate": todayNextYear,
-                "community": community,
-                "uniqueAddressID": uniqueId,
-            }
-
-            r = requests.post(url=API_ENDPOINT, data=data)
-
-            dataList = r.json()["dataList"]
-
-            for data in dataList:
-                # pickupType 0 = restafval
-                if "restafval" in resources:
-                    if data["pickupType"] == 0:
-                        waste_dict["restafval"] = data["pickupDates"][0].split("T")[0]
-                # pickupType 1 = gft
-                if "gft" in resources:
-                    if data["pickupType"] == 1:
-                        waste_dict["gft"] = data["pickupDates"][0].split("T")[0]
-                # pickupType 2 = papier
-                if "papier" in resources:
-                    if data["pickupType"] == 2:
-                        waste_dict["papier"] = data["pickupDates"][0].split("T")[0]
-                # pickupType 4 = textiel
-                if "textiel" in resources:
-                    if data["pickupType"] == 4:
-                        waste_dict["textiel"] = data["pickupDates"][0].split("T")[0]
-                # pickupType 10 = pbd
-                if "pbd" in resources:
-                    if data["pickupType"] == 10:
-                        waste_dict["pbd"] = data["pickupDates"][0].split("T")[0]
-
-            return waste_dict
-        except urllib.error.URLError as exc:
-            _LOGGER.error("Error occurred while fetching data: %r", exc.reason)
+            self.companyCode = SENSOR_LOCATIONS_TO_COMPANY_CODE["vijfheerenlanden"]
+
+            # The uniqueId and community of the address are only looked up the first time
+            dataList = await self.async_get_address_calendar(client, postcode, street_number)
+
+            waste_dict = VIJFHEERENLANDEN_PICKUP_TYPES.get_waste_dict(dataList, resources)
+
+            return CollectionSchedule.from_waste_dict(waste_dict)
+        except aiohttp.ClientError as exc:
+            _LOGGER.error("Error occurred while fetching data: %r", exc)
             return False
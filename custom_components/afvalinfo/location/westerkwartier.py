@@ -2,16 +2,15 @@ from ..const.const import (
     SENSOR_LOCATIONS_TO_URL,
     _LOGGER,
 )
+from ..schedule import CollectionSchedule
 from datetime import datetime
 from datetime import date
-import urllib.request
-import urllib.error
-import requests
+import aiohttp
 
 
 class WesterkwartierAfval(object):
 
-    def get_data(self, city, postcode, street_number, resources):
+    async def async_get_data(self, client, city, postcode, street_number, resources):
         _LOGGER.debug("Updating Waste collection dates")
 
         try:
@@ -21,9 +20,7 @@ class WesterkwartierAfval(object):
             )
 
             # sending post request and saving response as response object
-            r = requests.post(url=url)
-
-            items = r.json()["items"]
+            items = (await client.post_json(url))["items"]
 
             today = date.today()
 
@@ -32,18 +29,18 @@ class WesterkwartierAfval(object):
             for item in items:
                 if datetime.strptime(item["date"], '%Y-%m-%d').date() >= today:
                     if "restafval" in resources:
-                        if item["type"] == "rest" and not "restafval" in waste_dict:
-                            waste_dict["restafval"] = item["date"]
+                        if item["type"] == "rest":
+                            waste_dict.setdefault("restafval", []).append(item["date"])
                     if "gft" in resources:
-                        if item["type"] == "gft" and not "gft" in waste_dict:
-                            waste_dict["gft"] = item["date"]
+                        if item["type"] == "gft":
+                            waste_dict.setdefault("gft", []).append(item["date"])
                     # milb = milieuboer = papier, textiel, gft (maar gft staat ook al los als gft aangegeven)
-                    if item["type"] == "milb" and not "papier" in waste_dict:
+                    if item["type"] == "milb":
                         if "papier" in resources:
-                            waste_dict["papier"] = item["date"]
+                            waste_dict.setdefault("papier", []).append(item["date"])
                         if "textiel" in resources:
-                            waste_dict["textiel"] = item["date"]
-            return waste_dict
-        except urllib.error.URLError as exc:
-            _LOGGER.error("Error occurred while fetching data: %r", exc.reason)
+                            waste_dict.setdefault("textiel", []).append(item["date"])
+            return CollectionSchedule.from_waste_dict(waste_dict)
+        except aiohttp.ClientError as exc:
+            _LOGGER.error("Error occurred while fetching data: %r", exc)
             return False
@@ -3,15 +3,20 @@ from ..const.const import (
     SENSOR_LOCATIONS_TO_URL,
     _LOGGER,
 )
+from ..schedule import CollectionSchedule
+from ..soup import make_soup
 from datetime import datetime
 from datetime import timedelta
-from bs4 import BeautifulSoup
-import urllib.request
-import urllib.error
+from bs4 import SoupStrainer
+import aiohttp
+
+# Only this part of the page is parsed
+CONTAINER = SoupStrainer("div", {"id": "block-system-main"})
 
 
 class WesterwoldeAfval(object):
-    def get_date_from_afvaltype(self, ophaaldata, afvaltype, afvalnaam):
+    def get_dates_from_afvaltype(self, ophaaldata, afvaltype, afvalnaam):
+        dates = []
         try:
             tables = ophaaldata.find_all("table")
 
@@ -38,42 +43,44 @@ class WesterwoldeAfval(object):
                         if thMonth == currentMonth and thYear == currentYear:
                             currentDay = datetime.today().day
                             if int(day) >= currentDay:
-                                return thYear + "-" + thMonth + "-" + day
+                                dates.append(thYear + "-" + thMonth + "-" + day)
                         #If it's a month in the future
                         else:
-                            return thYear + "-" + thMonth + "-" + day
-            return ""
+                            dates.append(thYear + "-" + thMonth + "-" + day)
+            # all the dates from today
+            return dates
         except Exception as exc:
+            # keep the dates that were found before the error
+            if dates:
+                return dates
             _LOGGER.warning("Something went wrong while splitting data: %r. This probably means that trash type %r is not supported on your location", exc, afvalnaam)
             return ""
 
-    def get_data(self, city, postcode, street_number, resources):
+    async def async_get_data(self, client, city, postcode, street_number, resources):
         _LOGGER.debug("Updating Waste collection dates")
 
         try:
             url = SENSOR_LOCATIONS_TO_URL["westerwolde"][0].format(
                 postcode, street_number
             )
-            req = urllib.request.Request(url=url)
-            f = urllib.request.urlopen(req)
-            html = f.read().decode("utf-8")
+            html = await client.get_text(url)
 
-            soup = BeautifulSoup(html, "html.parser")
+            soup = make_soup(html, CONTAINER)
 
             content = soup.find("div", {"id": ['block-system-main']})
 
             # Place all possible values in the dictionary even if they are not necessary
             waste_dict = {}
             if "restafval" in resources:
-                waste_dict["restafval"] = self.get_date_from_afvaltype(content, "Rest", "restafval")
+                waste_dict["restafval"] = self.get_dates_from_afvaltype(content, "Rest", "restafval")
             if "gft" in resources:
-                waste_dict["gft"] = self.get_date_from_afvaltype(content, "GFT", "gft")
+                waste_dict["gft"] = self.get_dates_from_afvaltype(content, "GFT", "gft")
             if "papier" in resources:
-                waste_dict["papier"] = self.get_date_from_afvaltype(content, "Oud papier", "papier")
+                waste_dict["papier"] = self.get_dates_from_afvaltype(content, "Oud papier", "papier")
             if "pbd" in resources:
-                waste_dict["pbd"] = self.get_date_from_afvaltype(content, "PMD", "pbd")
+                waste_dict["pbd"] = self.get_dates_from_afvaltype(content, "PMD", "pbd")
 
-            return waste_dict
-        except urllib.error.URLError as exc:
+            return CollectionSchedule.from_waste_dict(waste_dict)
+        except aiohttp.ClientError as exc:
             _LOGGER.error("Error occurred while fetching data: %r", exc)
             return False
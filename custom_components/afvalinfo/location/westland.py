@@ -4,38 +4,41 @@ from ..const.const import (
     SENSOR_LOCATIONS_TO_URL,
     _LOGGER,
 )
+from ..schedule import CollectionSchedule
+from ..soup import make_soup
 
 from datetime import datetime
-from bs4 import BeautifulSoup
-import urllib.request
-import urllib.error
-import requests
+import aiohttp
 
 from datetime import date
 from dateutil.relativedelta import relativedelta
 
 
 class WestlandAfval(object):
-    def get_date_from_afvaltype(self, html, afvaltype, afvalnaam):
+    def get_dates_by_afvaltype(self, html):
+        # every <li> element has the trash type as class and the date in a <span> inside it
+        dates = {}
+        for tag in make_soup(html).find_all("li", class_=True):
+            for afvaltype in tag["class"]:
+                if afvaltype not in dates:
+                    dates[afvaltype] = tag.find("span", {"class": "text dag"})
+        return dates
+
+    def get_date_from_afvaltype(self, dates, afvaltype, afvalnaam):
         try:
-            tag = BeautifulSoup(html, "html.parser").find(
-                "li", {"class": afvaltype}
-            )
-            date = BeautifulSoup(str(tag), "html.parser").find(
-                "span", {"class": "text dag"}
-            )
+            pickup_date = dates[afvaltype]
             # get the value of the span
-            date = date.string
+            pickup_date = pickup_date.string
 
-            day = date.split()[1]
-            month = MONTH_TO_NUMBER[date.split()[2]]
-            year = date.split()[3]
+            day = pickup_date.split()[1]
+            month = MONTH_TO_NUMBER[pickup_date.split()[2]]
+            year = pickup_date.split()[3]
             return year + "-" + month + "-" + day
         except Exception as exc:
             _LOGGER.warning("Something went wrong while splitting data: %r. This probably means that trash type %r is not supported on your location", exc, afvalnaam)
             return ""
 
-    def get_data(self, city, postcode, street_number, resources):
+    async def async_get_data(self, client, city, postcode, street_number, resources):
         _LOGGER.debug("Updating Waste collection dates")
 
         try:
@@ -57,23 +60,23 @@ class WestlandAfval(object):
                 "huisnummer": street_number
             }
 
-            # Make a request. do not check certificate (verify=False), of you do verify, it fails
-            r = requests.post(url=API_ENDPOINT, headers=headers, data=data, verify=False)
+            # Make a request. do not check certificate (ssl=False), of you do verify, it fails
+            r = await client.post_json(API_ENDPOINT, headers=headers, data=data, ssl=False)
 
             # extracting response json
-            html = r.json()["html"]
+            dates = self.get_dates_by_afvaltype(r["html"])
 
             # find gft
             if "gft" in resources:
-                waste_dict["gft"] = self.get_date_from_afvaltype(html, "soort-groen", "gft")
+                waste_dict["gft"] = self.get_date_from_afvaltype(dates, "soort-groen", "gft")
             # find papier
             if "papier" in resources:
-                waste_dict["papier"] = self.get_date_from_afvaltype(html, "soort-papier", "papier")
+                waste_dict["papier"] = self.get_date_from_afvaltype(dates, "soort-papier", "papier")
             # find restafval
             if "restafval" in resources:
-                waste_dict["restafval"] = self.get_date_from_afvaltype(html, "soort-grijs", "restafval")
+                waste_dict["restafval"] = self.get_date_from_afvaltype(dates, "soort-grijs", "restafval")
 
-            return waste_dict
-        except urllib.error.URLError as exc:
-            _LOGGER.error("Error occurred while fetching data: %r", exc.reason)
+            return CollectionSchedule.from_waste_dict(waste_dict)
+        except aiohttp.ClientError as exc:
+            _LOGGER.error("Error occurred while fetching data: %r", exc)
             return False
@@ -1,26 +1,86 @@
 from ..const.const import (
     SENSOR_LOCATIONS_TO_COMPANY_CODE,
     SENSOR_LOCATIONS_TO_URL,
+    XIMMIO_FULL_WINDOW_IN_DAYS,
+    XIMMIO_WINDOW_MARGIN_IN_DAYS,
     _LOGGER,
 )
+from ..schedule import CollectionSchedule
+from .address import AddressNotFound, CachedAddressAfval
+from .pickuptype import PickupTypes
 
-from datetime import datetime
-import urllib.request
-import urllib.error
-import requests
+import aiohttp
 
-from datetime import date
+from datetime import date, timedelta
 from dateutil.relativedelta import relativedelta
 
-
-class XimmioAfval(object):
-    def get_data(self, city, postcode, street_number, resources):
+# The trash types of every _pickupTypeText with their priority, 0 is the best.
+# Combined containers are only used when there is no separate one. TREE is for christmas trees
+XIMMIO_PICKUP_TYPES = PickupTypes("_pickupTypeText", {
+    "GREEN": (("gft", 0),),
+    "GREENGREY": (("gft", 1), ("restafval", 1)),
+    "GREY": (("restafval", 0),),
+    "GREYPACKAGES": (("restafval", 2), ("pbd", 2)),
+    "PAPER": (("papier", 0),),
+    "PACKAGES": (("pbd", 0),),
+    "PLASTIC": (("pbd", 1),),
+    "TEXTILE": (("textiel", 0),),
+    "VET": (("textiel", 1),),
+})
+
+
+class XimmioAfval(CachedAddressAfval):
+    # Set by AfvalinfoData to the longest timespanindays of the sensors, None means a year
+    timespan_in_days = None
+    # The days after today to ask the dates for, it only grows
+    window_in_days = 0
+
+    async def async_get_address(self, client, postcode, street_number):
+        #######################################################
+        # First request: get uniqueId and community
+        API_ENDPOINT = SENSOR_LOCATIONS_TO_URL["ximmio"][0]
+
+        data = {
+            "postCode": postcode,
+            "houseNumber": street_number,
+            "companyCode": self.companyCode,
+        }
+
+        # sending post request and saving response as response object
+        r = await client.post_json(API_ENDPOINT, data=data)
+
+        # extracting response json
+        return {
+            "uniqueId": r["dataList"][0]["UniqueId"],
+            "community": r["dataList"][0]["Community"],
+        }
+
+    async def async_get_calendar(self, client, address):
+        #######################################################
+        # Second request: get the dates
+        API_ENDPOINT = SENSOR_LOCATIONS_TO_URL["ximmio"][1]
+
+        today = date.today()
+        endDate = min(today + relativedelta(years=1), today + timedelta(days=self.window_in_days))
+
+        data = {
+            "companyCode": self.companyCode,
+            "startDate": str(today),
+            "endDate": str(endDate),
+            "community": address["community"],
+            "uniqueAddressID": address["uniqueId"],
+        }
+
+        r = await client.post_json(API_ENDPOINT, data=data)
+        # an unknown uniqueId gives no dataList
+        if r.get("dataList") is None:
+            raise AddressNotFound(address)
+        return r["dataList"]
+
+    async def async_get_data(self, client, city, postcode, street_number, resources):
         _LOGGER.debug("Updating Waste collection dates")
 
         try:
-            # Place all possible values in the dictionary even if they are not necessary
-            waste_dict = {}
-
             location = ""
             acv = ["ede", "renkum", "renswoude", "veenendaal", "wageningen"]
             if city in acv:
@@ -57,86 +117,29 @@ class XimmioAfval(object):
                 location = "waardlanden"
 
             # Get companyCode for this location
-            companyCode = SENSOR_LOCATIONS_TO_COMPANY_CODE[location]
-
-            #######################################################
-            # First request: get uniqueId and community
-            API_ENDPOINT = SENSOR_LOCATIONS_TO_URL["ximmio"][0]
-
-            data = {
-                "postCode": postcode,
-                "houseNumber": street_number,
-                "companyCode": companyCode,
-            }
-
-            # sending post request and saving response as response object
-            r = requests.post(url=API_ENDPOINT, data=data)
-
-            # extracting response json
-            uniqueId = r.json()["dataList"][0]["UniqueId"]
-            community = r.json()["dataList"][0]["Community"]
-
-            #######################################################
-            # Second request: get the dates
-            API_ENDPOINT = SENSOR_LOCATIONS_TO_URL["ximmio"][1]
-
-            today = date.today()
-            todayNextYear = today + relativedelta(years=1)
-
-            data = {
-                "companyCode": companyCode,
-                "startDate": today,
-                "endDate": todayNextYear,
-                "community": community,
-                "uniqueAddressID": uniqueId,
-            }
-
-            r = requests.post(url=API_ENDPOINT, data=data)
-
-            dataList = r.json()["dataList"]
-
-            for data in dataList:
-                # _pickupTypeText = "GREEN"
-                if "gft" in resources:
-                    if data["_pickupTypeText"] == "GREEN":
-                        waste_dict["gft"] = data["pickupDates"][0].split("T")[0]
-                    if "gft" not in waste_dict or len(waste_dict["gft"]) == 0:
-                        if data["_pickupTypeText"] == "GREENGREY":
-                            waste_dict["gft"] = data["pickupDates"][0].split("T")[0]
-                # _pickupTypeText = "GREY"
-                if "restafval" in resources:
-                    if data["_pickupTypeText"] == "GREY":
-                        waste_dict["restafval"] = data["pickupDates"][0].split("T")[0]
-                    if "restafval" not in waste_dict or len(waste_dict["restafval"]) == 0:
-                        if data["_pickupTypeText"] == "GREENGREY":
-                            waste_dict["restafval"] = data["pickupDates"][0].split("T")[0]
-                    if "restafval" not in waste_dict or len(waste_dict["restafval"]) == 0:
-                        if data["_pickupTypeText"] == "GREYPACKAGES":
-                            waste_dict["restafval"] = data["pickupDates"][0].split("T")[0]
-                # _pickupTypeText = "PAPER"
-                if "papier" in resources:
-                    if data["_pickupTypeText"] == "PAPER":
-                        waste_dict["papier"] = data["pickupDates"][0].split("T")[0]
-                # _pickupTypeText = "PLASTIC"
-                if "pbd" in resources:
-                    if data["_pickupTypeText"] == "PACKAGES":
-                        waste_dict["pbd"] = data["pickupDates"][0].split("T")[0]
-                    if "pbd" not in waste_dict:
-                        if data["_pickupTypeText"] == "PLASTIC":
-                            waste_dict["pbd"] = data["pickupDates"][0].split("T")[0]
-                    if "pbd" not in waste_dict or len(waste_dict["pbd"]) == 0:
-                        if data["_pickupTypeText"] == "GREYPACKAGES":
-                            waste_dict["pbd"] = data["pickupDates"][0].split("T")[0]
-                # _pickupTypeText = "TEXTILE"
-                if "textiel" in resources:
-                    if data["_pickupTypeText"] == "TEXTILE":
-                        waste_dict["textiel"] = data["pickupDates"][0].split("T")[0]
-                    if "textiel" not in waste_dict or len(waste_dict["textiel"]) == 0:
-                        if data["_pickupTypeText"] == "VET":
-                            waste_dict["textiel"] = data["pickupDates"][0].split("T")[0]
-                # _pickupTypeText = "TREE" = kerstbomen
-
-            return waste_dict
-        except urllib.error.URLError as exc:
-            _LOGGER.error("Error occurred while fetching data: %r", exc.reason)
+            self.companyCode = SENSOR_LOCATIONS_TO_COMPANY_CODE[location]
+
+            # Only ask for the dates the sensors can show, with a margin
+            window_in_days = XIMMIO_FULL_WINDOW_IN_DAYS
+            if self.timespan_in_days is not None:
+                window_in_days = min(self.timespan_in_days + XIMMIO_WINDOW_MARGIN_IN_DAYS, XIMMIO_FULL_WINDOW_IN_DAYS)
+            self.window_in_days = max(self.window_in_days, window_in_days)
+
+            afvalnamen = XIMMIO_PICKUP_TYPES.get_afvalnamen(resources)
+            while True:
+                # The uniqueId and community of the address are only looked up the first time
+                dataList = await self.async_get_address_calendar(client, postcode, street_number)
+                waste_dict = XIMMIO_PICKUP_TYPES.get_waste_dict(dataList, resources)
+
+                # A trash type without a date in the window may just be collected less often,
+                # Ximmio can also leave out its pickup type then. Ask again for twice as many days,
+                # the longer window is kept for the next refreshes
+                if self.window_in_days >= XIMMIO_FULL_WINDOW_IN_DAYS or all(waste_dict.get(afvalnaam) for afvalnaam in afvalnamen):
+                    break
+                self.window_in_days = min(self.window_in_days * 2, XIMMIO_FULL_WINDOW_IN_DAYS)
+                _LOGGER.debug("Not all trash types have a date, asking Ximmio for %d days", self.window_in_days)
+
+            return CollectionSchedule.from_waste_dict(waste_dict)
+        except aiohttp.ClientError as exc:
+            _LOGGER.error("Error occurred while fetching data: %r", exc)
             return False
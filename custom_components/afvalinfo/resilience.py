@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+import asyncio
+import random
+
+import aiohttp
+
+from homeassistant.util import dt as dt_util
+
+from .const.const import (
+    _LOGGER,
+    CIRCUIT_BREAKER_COOLDOWN,
+    CIRCUIT_BREAKER_THRESHOLD,
+    RETRY_ATTEMPTS,
+    RETRY_BACKOFF_IN_SECONDS,
+)
+
+# Worth another try, the location might be back in a few seconds
+NETWORK_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError)
+# The location answered with something we can't read, asking again won't help
+PARSE_ERRORS = (ValueError, KeyError, IndexError, TypeError, AttributeError)
+
+
+class CircuitBreaker(object):
+    """Stops calling a location that can't be reached, until the cool-down has passed."""
+
+    def __init__(self, name, threshold=CIRCUIT_BREAKER_THRESHOLD, cooldown=CIRCUIT_BREAKER_COOLDOWN):
+        self.name = name
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened = None
+
+    @property
+    def is_open(self):
+        if self.opened is None:
+            return False
+        # After the cool-down one call is let through, another failure opens it again
+        return dt_util.utcnow() - self.opened < self.cooldown
+
+    def success(self):
+        self.failures = 0
+        self.opened = None
+
+    def failure(self):
+        self.failures += 1
+        if self.failures >= self.threshold:
+            if not self.is_open:
+                _LOGGER.warning(
+                    "Location %s failed %d times in a row, not calling it for %s",
+                    self.name, self.failures, self.cooldown,
+                )
+            self.opened = dt_util.utcnow()
+
+
+async def async_get_data(breaker, provider, *args):
+    """Call provider.async_get_data with retries, returns False when it failed."""
+    if breaker.is_open:
+        _LOGGER.debug("Not calling location %s, it failed too often", breaker.name)
+        return False
+
+    for attempt in range(RETRY_ATTEMPTS):
+        if attempt:
+            # Jittered exponential backoff, so the sensors of one location don't retry in step
+            await asyncio.sleep(random.uniform(0, RETRY_BACKOFF_IN_SECONDS * 2 ** attempt))
+        try:
+            schedule = await provider.async_get_data(*args)
+        except NETWORK_ERRORS as exc:
+            _LOGGER.warning("Error occurred while fetching data from %s: %r", breaker.name, exc)
+            continue
+        except PARSE_ERRORS as exc:
+            # Most likely something of this address, like an unknown postcode. The location
+            # itself answered, so the other addresses on it can still be called
+            _LOGGER.error("Error occurred while reading data from %s: %r", breaker.name, exc)
+            return False
+        # The location modules log and return False on a network error themselves
+        if schedule is False:
+            continue
+        breaker.success()
+        return schedule
+
+    breaker.failure()
+    return False
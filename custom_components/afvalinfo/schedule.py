@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+from bisect import bisect_left
+from datetime import date, datetime
+
+from .const.const import _LOGGER
+
+
+class CollectionSchedule(object):
+    """Sorted collection dates per waste type, for the whole period a location returned."""
+
+    def __init__(self):
+        self._dates = {}
+        # {date: {waste_type, ...}}, built again after a date is added
+        self._waste_types_by_date = None
+
+    @classmethod
+    def from_waste_dict(cls, waste_dict):
+        # waste_dict values are a "%Y-%m-%d" date string or a list of them. Empty values are skipped
+        schedule = cls()
+        for waste_type, dates in waste_dict.items():
+            if isinstance(dates, (str, date)):
+                dates = [dates]
+            for collection_date in dates:
+                schedule.add(waste_type, collection_date)
+        return schedule
+
+    def add(self, waste_type, collection_date):
+        if not collection_date:
+            return
+        if not isinstance(collection_date, date):
+            try:
+                collection_date = datetime.strptime(collection_date, "%Y-%m-%d").date()
+            except ValueError:
+                _LOGGER.warning("Invalid collection date %r for trash type %r", collection_date, waste_type)
+                return
+        elif isinstance(collection_date, datetime):
+            collection_date = collection_date.date()
+
+        dates = self._dates.setdefault(waste_type, [])
+        i = bisect_left(dates, collection_date)
+        if i == len(dates) or dates[i] != collection_date:
+            dates.insert(i, collection_date)
+            self._waste_types_by_date = None
+
+    def next_date(self, waste_type, day):
+        """First collection date of waste_type on or after day, or None."""
+        dates = self._dates.get(waste_type)
+        if not dates:
+            return None
+        i = bisect_left(dates, day)
+        return dates[i] if i < len(dates) else None
+
+    def waste_types_on(self, day):
+        """The waste types collected on day, an empty set if none."""
+        if self._waste_types_by_date is None:
+            self._waste_types_by_date = {}
+            for waste_type, dates in self._dates.items():
+                for collection_date in dates:
+                    self._waste_types_by_date.setdefault(collection_date, set()).add(waste_type)
+        return self._waste_types_by_date.get(day, frozenset())
+
+    def as_dict(self):
+        # {waste_type: ["%Y-%m-%d", ...]}, the opposite of from_waste_dict
+        return {
+            waste_type: [collection_date.isoformat() for collection_date in dates]
+            for waste_type, dates in self._dates.items() if dates
+        }
+
+    def dates(self, waste_type):
+        return list(self._dates.get(waste_type, ()))
+
+    @property
+    def waste_types(self):
+        return [waste_type for waste_type, dates in self._dates.items() if dates]
+
+    def __contains__(self, waste_type):
+        return bool(self._dates.get(waste_type))
+
+    def __bool__(self):
+        return any(self._dates.values())
+
+    def __eq__(self, other):
+        return isinstance(other, CollectionSchedule) and self._dates == other._dates
+
+    def __repr__(self):
+        return "CollectionSchedule({0!r})".format(self._dates)
@@ -42,15 +42,14 @@ Schiermonnikoog                 Geen kalender
 ############################################################################################################
 """
 
+import asyncio
 import voluptuous as vol
-from datetime import datetime, date, timedelta
+from babel import Locale, UnknownLocaleError
+from datetime import timedelta
 from dateutil.relativedelta import relativedelta
-import urllib.error
-from babel import Locale
-from babel.dates import format_date, format_datetime, format_time
-import re
 
 from .const.const import (
+    DOMAIN,
     MIN_TIME_BETWEEN_UPDATES,
     _LOGGER,
     CONF_CITY,
@@ -60,7 +59,9 @@ from .const.const import (
     CONF_DATE_FORMAT,
     CONF_TIMESPAN_IN_DAYS,
     CONF_LOCALE,
+    CONF_CACHE_TTL_IN_HOURS,
     SENSOR_PREFIX,
+    ATTR_LAST_FETCHED,
     ATTR_LAST_UPDATE,
     ATTR_HIDDEN,
     ATTR_DAYS_UNTIL_COLLECTION_DATE,
@@ -69,81 +70,66 @@ from .const.const import (
     SENSOR_TYPES,
 )
 
-from .location.sliedrecht import SliedrechtAfval
-from .location.deafvalapp import DeAfvalAppAfval
-from .location.westerkwartier import WesterkwartierAfval
-from .location.westland import WestlandAfval
-from .location.rova import RovaAfval
-from .location.venlo import VenloAfval
-from .location.hvc import HvcAfval
-from .location.alkmaar import AlkmaarAfval
-from .location.alphenaandenrijn import AlphenAanDenRijnAfval
-from .location.mijnafvalwijzer import MijnAfvalWijzerAfval
-from .location.suez import SuezAfval
-from .location.omrin import OmrinAfval
-from .location.defriesemeren import DeFrieseMerenAfval
-from .location.veldhoven import VeldhovenAfval
-from .location.venray import VenrayAfval
-from .location.gad import GadAfval
-from .location.zuidwestfriesland import ZuidWestFrieslandAfval
-from .location.blink import BlinkAfval
-from .location.spaarnelanden import SpaarnelandenAfval
-from .location.cyclus import CyclusAfval
-from .location.circulusberkel import CirculusBerkelAfval
-from .location.irado import IradoAfval
-from .location.rd4 import Rd4Afval
-from .location.dar import DarAfval
-from .location.drimmelen import DrimmelenAfval
-from .location.zrd import ZrdAfval
-from .location.rmn import RmnAfval
-from .location.goereeoverflakkee import GoereeOverflakkeeAfval
-from .location.berkelland import BerkellandAfval
-from .location.middendrenthe import MiddenDrentheAfval
-from .location.denhaag import DenHaagAfval
-from .location.purmerend import PurmerendAfval
-from .location.borsele import BorseleAfval
-from .location.avalex import AvalexAfval
-from .location.ximmio import XimmioAfval
-from .location.cranendonck import CranendonckAfval
-from .location.peelenmaas import PeelEnMaasAfval
-from .location.afvalstoffendienstkalender import AfvalstoffendienstkalenderAfval
-from .location.schouwenduiveland import SchouwenDuivelandAfval
-from .location.waalre import WaalreAfval
-from .location.groningen import GroningenAfval
-from .location.beesel import BeeselAfval
-from .location.hoekschewaard import HoekscheWaardAfval
-from .location.katwijk import KatwijkAfval
-from .location.uden import UdenAfval
-from .location.westerwolde import WesterwoldeAfval
-
+from .cache import AfvalinfoCache
+from .client import async_create_client
+from .dateformat import get_date_formatter
+from .entity import AfvalinfoEntity
+from .resilience import CircuitBreaker, async_get_data
+from .location.address import CachedAddressAfval
+from .location.registry import GEMEENTE_TO_LOCATION, get_provider
 from .sensortomorrow import AfvalInfoTomorrowSensor
 from .sensortoday import AfvalInfoTodaySensor
 
 from homeassistant.components.sensor import PLATFORM_SCHEMA
 import homeassistant.helpers.config_validation as cv
 from homeassistant.const import CONF_RESOURCES
-from homeassistant.util import Throttle
-from homeassistant.helpers.entity import Entity
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_track_point_in_utc_time
+import homeassistant.util.dt as dt_util
+
+GEMEENTE = vol.All(
+    cv.string, vol.Strip, vol.Lower, vol.In(GEMEENTE_TO_LOCATION, msg="Unsupported location (gemeente)")
+)
+
+
+def locale(value):
+    # The named days and months of the dateformat are looked up in the locale
+    try:
+        Locale.parse(value)
+    except (ValueError, UnknownLocaleError):
+        raise vol.Invalid("Unsupported locale")
+    return value
+
 
 PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
     {
         vol.Required(CONF_RESOURCES, default=[]): vol.All(
             cv.ensure_list, [vol.In(SENSOR_TYPES)]
         ),
-        vol.Optional(CONF_CITY, default=""): cv.string,
-        vol.Optional(CONF_LOCATION, default="sliedrecht"): cv.string,
+        vol.Optional(CONF_CITY, default=""): vol.Any("", GEMEENTE),
+        vol.Optional(CONF_LOCATION, default="sliedrecht"): GEMEENTE,
         vol.Required(CONF_POSTCODE, default="3361AB"): cv.string,
         vol.Required(CONF_STREET_NUMBER, default="1"): cv.string,
         vol.Optional(CONF_DATE_FORMAT, default = "%d-%m-%Y"): cv.string,
         vol.Optional(CONF_TIMESPAN_IN_DAYS, default="365"): cv.string,
-        vol.Optional(CONF_LOCALE, default = "en"): cv.string,
+        vol.Optional(CONF_LOCALE, default = "en"): vol.All(cv.string, locale),
+        vol.Optional(CONF_CACHE_TTL_IN_HOURS, default=24): cv.positive_int,
     }
 )
 
 
-def setup_platform(hass, config, add_entities, discovery_info=None):
+async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
     _LOGGER.debug("Setup Afvalinfo sensor")
 
+    # One http client and one cache for all the platforms
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if "client" not in domain_data:
+        domain_data["client"] = async_create_client(hass)
+        domain_data["cache"] = AfvalinfoCache(hass)
+        domain_data["data"] = {}
+        domain_data["lock"] = asyncio.Lock()
+        domain_data["breakers"] = {}
+
     location = config.get(CONF_CITY).lower().strip()
     if len(location) == 0:
         location = config.get(CONF_LOCATION).lower().strip()
@@ -152,18 +138,47 @@ def setup_platform(hass, config, add_entities, discovery_info=None):
     date_format = config.get(CONF_DATE_FORMAT).strip()
     timespan_in_days = config.get(CONF_TIMESPAN_IN_DAYS)
     locale = config.get(CONF_LOCALE)
-
-    try:
-        resourcesMinusTodayAndTomorrow = config[CONF_RESOURCES].copy()
-        if "trash_type_today" in resourcesMinusTodayAndTomorrow:
-            resourcesMinusTodayAndTomorrow.remove("trash_type_today")
-        if "trash_type_tomorrow" in resourcesMinusTodayAndTomorrow:
-            resourcesMinusTodayAndTomorrow.remove("trash_type_tomorrow")
-
-        data = AfvalinfoData(location, postcode, street_number, resourcesMinusTodayAndTomorrow)
-    except urllib.error.HTTPError as error:
-        _LOGGER.error(error.reason)
-        return False
+    cache_ttl = timedelta(hours=config.get(CONF_CACHE_TTL_IN_HOURS))
+
+    resourcesMinusTodayAndTomorrow = config[CONF_RESOURCES].copy()
+    if "trash_type_today" in resourcesMinusTodayAndTomorrow:
+        resourcesMinusTodayAndTomorrow.remove("trash_type_today")
+    if "trash_type_tomorrow" in resourcesMinusTodayAndTomorrow:
+        resourcesMinusTodayAndTomorrow.remove("trash_type_tomorrow")
+
+    # All the platforms for the same address share one AfvalinfoData, which fetches
+    # the resources of all of them at once
+    key = (location, postcode, street_number)
+    async with domain_data["lock"]:
+        data = domain_data["data"].get(key)
+        if data is None:
+            # Only import the module of the provider for this location
+            provider = (await hass.async_add_executor_job(get_provider, location))()
+
+            cache = domain_data["cache"]
+            await cache.async_load()
+
+            # Locations which serve more than one gemeente share one circuit breaker
+            provider_name = GEMEENTE_TO_LOCATION[location]
+            breaker = domain_data["breakers"].get(provider_name)
+            if breaker is None:
+                breaker = domain_data["breakers"][provider_name] = CircuitBreaker(provider_name)
+
+            data = AfvalinfoData(
+                hass,
+                domain_data["client"],
+                cache,
+                AfvalinfoCache.key(provider_name, postcode, street_number),
+                provider,
+                breaker,
+                location,
+                postcode,
+                street_number,
+            )
+            domain_data["data"][key] = data
+
+    # Serve the last known collection dates right away, they are refreshed in the background
+    data.add_resources(resourcesMinusTodayAndTomorrow, cache_ttl, int(timespan_in_days))
 
     entities = []
 
@@ -176,272 +191,182 @@ def setup_platform(hass, config, add_entities, discovery_info=None):
 
         #Add sensor -trash_type_today
         if sensor_type.title().lower() == "trash_type_today":
-            today = AfvalInfoTodaySensor(data, sensor_type, entities)
+            today = AfvalInfoTodaySensor(data, sensor_type, resourcesMinusTodayAndTomorrow)
             entities.append(today)
         #Add sensor -trash_type_tomorrow
         if sensor_type.title().lower() == "trash_type_tomorrow":
-            tomorrow = AfvalInfoTomorrowSensor(data, sensor_type, entities)
+            tomorrow = AfvalInfoTomorrowSensor(data, sensor_type, resourcesMinusTodayAndTomorrow)
             entities.append(tomorrow)
 
-    add_entities(entities)
+    # The sensors get their state from data when they are added, see AfvalinfoEntity
+    async_add_entities(entities)
 
 
 class AfvalinfoData(object):
-    def __init__(self, location, postcode, street_number, resources):
+    def __init__(self, hass, client, cache, cache_key, provider, breaker, location, postcode, street_number):
+        self.hass = hass
+        self.client = client
+        self.provider = provider
+        self.breaker = breaker
         self.data = None
         self.location = location
         self.postcode = postcode
         self.street_number = street_number
-        self.resources = resources
-
-    @Throttle(MIN_TIME_BETWEEN_UPDATES)
-    def update(self):
+        self.resources = []
+        self.fetched = None
+        self._cache = cache
+        self._cache_key = cache_key
+        self._cache_ttl = None
+        self._fetched_resources = set()
+        self._requested_resources = set()
+        self._restored = False
+        # The sensors to tell about new collection dates, and the timer of the next refresh
+        self._listeners = []
+        self._refresh_task = None
+        self._unsub_refresh = None
+
+        # The id the location gave this address, so it doesn't have to be looked up again
+        self._address = (None, None)
+        if isinstance(provider, CachedAddressAfval):
+            cached = cache.get_address(cache_key)
+            if cached:
+                provider.address, provider.address_resolved = self._address = cached
+
+    def add_resources(self, resources, cache_ttl, timespan_in_days):
+        for resource in resources:
+            if resource not in self.resources:
+                self.resources.append(resource)
+        self._cache_ttl = cache_ttl if self._cache_ttl is None else min(self._cache_ttl, cache_ttl)
+
+        # Providers that ask for dates by period get the longest timespan the sensors show
+        if hasattr(self.provider, "timespan_in_days"):
+            self.provider.timespan_in_days = max(self.provider.timespan_in_days or 0, timespan_in_days)
+
+        if self.data is None:
+            cached = self._cache.get(self._cache_key, self.resources)
+            if cached:
+                self.data, self.fetched = cached
+                self._fetched_resources = set(self.resources)
+                self._restored = True
+
+    def is_fresh(self):
+        if not self.data or self.fetched is None:
+            return False
+        if not set(self.resources) <= self._fetched_resources:
+            return False
+        if dt_util.utcnow() - self.fetched >= self._cache_ttl:
+            return False
+        # Locations which only show the next date need a new fetch once that date has passed
+        today = dt_util.now().date()
+        return all(self.data.next_date(waste_type, today) for waste_type in self.data.waste_types)
+
+    def next_update(self):
+        """When to refresh: at local midnight, when the dates move on, or earlier
+        when the collection dates have to be fetched again."""
+        midnight = dt_util.as_utc(dt_util.start_of_local_day(dt_util.now() + timedelta(days=1)))
+        if self.is_fresh():
+            return min(midnight, self.fetched + self._cache_ttl)
+        # Not fetched yet, or the location could not be reached, try again later
+        return min(midnight, dt_util.utcnow() + MIN_TIME_BETWEEN_UPDATES)
+
+    @callback
+    def async_add_listener(self, update_callback):
+        """Call update_callback with every refresh, returns the function that stops it."""
+        self._listeners.append(update_callback)
+        # A new sensor gets its state right away, a new platform may need more resources
+        self.async_request_refresh()
+
+        @callback
+        def remove_listener():
+            self._listeners.remove(update_callback)
+            if not self._listeners and self._unsub_refresh is not None:
+                self._unsub_refresh()
+                self._unsub_refresh = None
+
+        return remove_listener
+
+    @callback
+    def async_request_refresh(self):
+        # Only one refresh at a time, the ones asked for while it runs are the same refresh
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = self.hass.async_create_task(self._async_refresh())
+        return self._refresh_task
+
+    async def _async_refresh(self):
+        restored, self._restored = self._restored, False
+        try:
+            if not self.is_fresh():
+                if restored:
+                    # Just started with cached data, show it before waiting for the network
+                    self._async_update_listeners()
+                await self.async_fetch()
+                # A platform that added resources during the fetch joined this refresh,
+                # fetch those right away instead of at the retry
+                while not set(self.resources) <= self._requested_resources:
+                    await self.async_fetch()
+        finally:
+            # The sensors get the new state even when the next refresh could not be scheduled
+            try:
+                self._async_schedule_refresh()
+            except Exception:
+                _LOGGER.exception("Error occurred while scheduling the next refresh of %s %s", self.postcode, self.street_number)
+            self._async_update_listeners()
+
+    @callback
+    def _async_update_listeners(self):
+        for update_callback in list(self._listeners):
+            # One sensor that fails doesn't keep the others of the address from their update
+            try:
+                update_callback()
+            except Exception:
+                _LOGGER.exception("Error occurred while updating a sensor of %s %s", self.postcode, self.street_number)
+
+    @callback
+    def _async_schedule_refresh(self):
+        if self._unsub_refresh is not None:
+            self._unsub_refresh()
+            self._unsub_refresh = None
+        if self._listeners:
+            self._unsub_refresh = async_track_point_in_utc_time(
+                self.hass, self._async_refresh_at, self.next_update()
+            )
+
+    @callback
+    def _async_refresh_at(self, now):
+        self._unsub_refresh = None
+        self.async_request_refresh()
+
+    async def async_fetch(self):
         _LOGGER.debug("Updating Waste collection dates")
-        afvalstoffendienstkalender = ["haaren", "heusden", "oisterwijk", "s-hertogenbosch", "vught"]
-        if self.location in afvalstoffendienstkalender:
-            self.data = AfvalstoffendienstkalenderAfval().get_data(
-                self.location, self.postcode, self.street_number, self.resources
-            )
-        alkmaar = ["alkmaar"]
-        if self.location in alkmaar:
-            self.data = AlkmaarAfval().get_data(
-                self.location, self.postcode, self.street_number, self.resources
-            )
-        alphenaandenrijn = ["alphen aan den rijn"]
-        if self.location in alphenaandenrijn:
-            self.data = AlphenAanDenRijnAfval().get_data(
-                self.location, self.postcode, self.street_number, self.resources
-            )
-        avalex = ["delft", "leidschendam-voorburg", "midden-delfland", "pijnacker-nootdorp", "rijswijk", "wassenaar"]
-        if self.location in avalex:
-            self.data = AvalexAfval().get_data(
-                self.location, self.postcode, self.street_number, self.resources
-            )
-        beesel = ["beesel"]
-        if self.location in beesel:
-            self.data = BeeselAfval().get_data(
-                self.location, self.postcode, self.street_number, self.resources
-            )
-        berkelland = ["berkelland"]
-        if self.location in berkelland:
-            self.data = BerkellandAfval().get_data(
-                self.location, self.postcode, self.street_number, self.resources
-            )
-        blink = ["asten", "deurne", "gemert-bakel", "heeze-leende", "laarbeek", "nuenen", "someren"]
-        if self.location in blink:
-            self.data = BlinkAfval().get_data(
-                self.location, self.postcode, self.street_number, self.resources
-            )
-        borsele = ["borsele"]
-        if self.location in borsele:
-            self.data = BorseleAfval().get_data(
-                self.location, self.postcode, self.street_number, self.resources
-            )
-        circulusberkel = ["apeldoorn", "bronckhorst", "brummen", "deventer", "doesburg", "epe", "lochem", "voorst", "zutphen"]
-        if self.location in circulusberkel:
-            self.data = CirculusBerkelAfval().get_data(
-                self.location, self.postcode, self.street_number, self.resources
-            )
-        cranendonck = ["cranendonck"]
-        if self.location in cranendonck:
-            self.data = CranendonckAfval().get_data(
-                self.location, self.postcode, self.street_number, self.resources
-            )
-        cyclus = ["bodegraven-reeuwijk", "gouda", "kaag en braassem", "krimpenerwaard", "montfoort", "nieuwkoop", "waddinxveen", "zuidplas"]
-        if self.location in cyclus:
-            self.data = CyclusAfval().get_data(
-                self.location, self.postcode, self.street_number, self.resources
-            )
-        dar = ["berg en dal", "beuningen", "druten", "heumen", "nijmegen", "wijchen"]
-        if self.location in dar:
-            self.data = DarAfval().get_data(
-                self.location, self.postcode, self.street_number, self.resources
-            )
-        deafvalapp = ["boekel", "boxmeer", "buren", "cuijk", "culemborg", "echt-susteren", "grave", "helmond", "maasdriel", "mill en sint hubert", "neder-betuwe", "sint anthonis", "son en breugel", "terneuzen", "tiel", "west betuwe", "west maas en waal", "zaltbommel"]
-        if self.location in deafvalapp:
-            self.data = DeAfvalAppAfval().get_data(
-                self.location, self.postcode, self.street_number, self.resources
-            )
-        denhaag = ["den haag"]
-        if self.location in denhaag:
-            self.data = DenHaagAfval().get_data(
-                self.location, self.postcode, self.street_number, self.resources
-            )
-        defriesemeren = ["de friese meren"]
-        if self.location in defriesemeren:
-            self.data = DeFrieseMerenAfval().get_data(
-                self.location, self.postcode, self.street_number, self.resources
-            )
-        drimmelen = ["drimmelen"]
-        if self.location in drimmelen:
-            self.data = DrimmelenAfval().get_data(
-                self.location, self.postcode, self.street_number, self.resources
-            )
-        gad = ["blaricum", "gooise meren", "hilversum", "huizen", "laren", "weesp", "wijdemeren"]
-        if self.location in gad:
-            self.data = GadAfval().get_data(
-                self.location, self.postcode, self.street_number, self.resources
-            )
-        goereeoverflakkee = ["goeree-overflakkee"]
-        if self.location in goereeoverflakkee:
-            self.data = GoereeOverflakkeeAfval().get_data(
-                self.location, self.postcode, self.street_number, self.resources
-            )
-        groningen = ["groningen", "het hogeland bw", "loppersum"]
-        if self.location in groningen:
-            self.data = GroningenAfval().get_data(
-                self.location, self.postcode, self.street_number, self.resources
-            )
-        hoekschewaard = ["hoeksche waard"]
-        if self.location in hoekschewaard:
-            self.data = HoekscheWaardAfval().get_data(
-                self.location, self.postcode, self.street_number, self.resources
-            )
-        hvc = ["alblasserdam", "bergen", "beverwijk", "den helder", "dordrecht", "drechterland", "enkhuizen", "hendrik-ido-ambacht", "heemskerk", "hollands kroon", "hoorn", "koggenland", "lelystad", "medemblik", "noordoostpolder", "opmeer", "papendrecht", "schagen", "stede broec", "velsen", "wormerland",
-        "zaanstad", "zeewolde", "zwijndrecht"]
-        if self.location in hvc:
-            self.data = HvcAfval().get_data(
-                self.location, self.postcode, self.street_number, self.resources
-            )
-        irado = ["capelle aan den ijssel", "schiedam", "vlaardingen"]
-        if self.location in irado:
-            self.data = IradoAfval().get_data(
-                self.location, self.postcode, self.street_number, self.resources
-            )
-        katwijk = ["katwijk"]
-        if self.location in katwijk:
-            self.data = KatwijkAfval().get_data(
-                self.location, self.postcode, self.street_number, self.resources
-            )
-        middendrenthe = ["midden-drenthe"]
-        if self.location in middendrenthe:
-            self.data = MiddenDrentheAfval().get_data(
-                self.location, self.postcode, self.street_number, self.resources
-            )
-        mijnafvalwijzer = ["aa en hunze", "alphen-chaam", "assen", "altena", "amstelveen", "baarle-nassau", "barneveld", "beek", "beekdaelen", "bergeijk", "bergen op zoom", "bernheze", "best", "bladel", "borger-odoorn", "boxtel", "breda", "brielle", "castricum", "de ronde venen", "de wolden", "de bilt",
-        "doetinchem", "dongen", "dronten", "duiven", "eersel", "eindhoven", "elburg", "ermelo", "etten-leur", "geertruidenberg", "geldrop-mierlo", "gilze en rijen", "goirle", "halderberge", "harderwijk", "heerhugowaard", "heiloo", "hilvarenbeek", "horst aan de maas", "houten", "kampen", "krimpen aan den ijssel",
-        "langedijk", "lansingerland", "leiden", "leiderdorp", "leudal", "leusden", "lingewaard", "loon op zand", "lopik", "maasgouw", "meierijstad", " midden-groningen", "moerdijk", "nijkerk", "noordenveld", "nunspeet", "oirschot", "oldambt", "oldebroek", "oosterhout", "oss", "oude ijsselstreek", "oude pekela",
-        "putten", "oudewater", "overbetuwe", "rheden", "rhenen", "rijssen-holten", "roerdalen", "roermond", "roosendaal", "rotterdam", "rucphen", "scherpenzeel", "sint-michielsgestel", "sittard-geleen", "smallingerland", "stadskanaal", "stein", "stichtse vecht", "teylingen", "tilburg", "tynaarlo", "uitgeest",
-        "utrecht", "utrechtse heuvelrug", "valkenswaard", "veendam", "waalwijk", "waterland", "wijk bij duurstede", "westervoort", "westvoorne", "woensdrecht", "woerden", "zevenaar", "zoetermeer", "zoeterwoude"]
-        if self.location in mijnafvalwijzer:
-            self.data = MijnAfvalWijzerAfval().get_data(
-                self.location, self.postcode, self.street_number, self.resources
-            )
-        omrin = ["achtkarspelen", "ameland", "appingedam", "dantumadeel f", "harlingen", "heerenveen", "het hogeland", "leeuwarden", "noardeast fryslan", "ooststellingwerf", "opsterland", "terschelling", "tietjerksteradeel", "waadhoeke", "weststellingwerf"]
-        if self.location in omrin:
-            self.data = OmrinAfval().get_data(
-                self.location, self.postcode, self.street_number, self.resources
-            )
-        peelenmaas = ["peel en maas"]
-        if self.location in peelenmaas:
-            self.data = PeelEnMaasAfval().get_data(
-                self.location, self.postcode, self.street_number, self.resources
-            )
-        purmerend = ["beemster", "purmerend"]
-        if self.location in purmerend:
-            self.data = PurmerendAfval().get_data(
-                self.location, self.postcode, self.street_number, self.resources
-            )
-        rd4 = ["brunssum", "eijsden-margraten", "gulpen-wittem", "heerlen", "kerkrade", "landgraaf", "maastricht", "meerssen", "simpelveld", "vaals", "valkenburg aan de geul", "voerendaal"]
-        if self.location in rd4:
-            self.data = Rd4Afval().get_data(
-                self.location, self.postcode, self.street_number, self.resources
-            )
-        rmn = ["baarn", "bunnik", "ijsselstein", "nieuwegein", "soest", "zeist"]
-        if self.location in rmn:
-            self.data = RmnAfval().get_data(
-                self.location, self.postcode, self.street_number, self.resources
-            )
-        rova = ["aalten", "amersfoort", "bunschoten", "dalfsen", "dinkelland", "hardenberg", "hattem", "heerde", "olst-wijhe", "ommen", "oost gelre", "raalte", "staphorst", "steenwijkerland", "tubbergen", "twenterand", "urk", "westerveld", "winterswijk",
-        "woudenberg", "zwartewaterland", "zwolle"]
-        if self.location in rova:
-            self.data = RovaAfval().get_data(
-                self.location, self.postcode, self.street_number, self.resources
-            )
-        schouwenduiveland = ["schouwen-duiveland"]
-        if self.location in schouwenduiveland:
-            self.data = SchouwenDuivelandAfval().get_data(
-                self.location, self.postcode, self.street_number, self.resources
-            )
-        sliedrecht = ["sliedrecht"]
-        if self.location in sliedrecht:
-            self.data = SliedrechtAfval().get_data(
-                self.location, self.postcode, self.street_number, self.resources
-            )
-        spaarnelanden = ["haarlem", "zandvoort"]
-        if self.location in spaarnelanden:
-            self.data = SpaarnelandenAfval().get_data(
-                self.location, self.postcode, self.street_number, self.resources
-            )
-        suez = ["arnhem"]
-        if self.location in suez:
-            self.data = SuezAfval().get_data(
-                self.location, self.postcode, self.street_number, self.resources
-            )
-        uden = ["uden"]
-        if self.location in uden:
-            self.data = UdenAfval().get_data(
-                self.location, self.postcode, self.street_number, self.resources
-            )
-        veldhoven = ["veldhoven"]
-        if self.location in veldhoven:
-            self.data = VeldhovenAfval().get_data(
-                self.location, self.postcode, self.street_number, self.resources
-            )
-        venlo = ["venlo"]
-        if self.location in venlo:
-            self.data = VenloAfval().get_data(
-                self.location, self.postcode, self.street_number, self.resources
-            )
-        venray = ["venray"]
-        if self.location in venray:
-            self.data = VenrayAfval().get_data(
-                self.location, self.postcode, self.street_number, self.resources
-            )
-        waalre = ["waalre"]
-        if self.location in waalre:
-            self.data = WaalreAfval().get_data(
-                self.location, self.postcode, self.street_number, self.resources
-            )
-        westerkwartier = ["westerkwartier"]
-        if self.location in westerkwartier:
-            self.data = WesterkwartierAfval().get_data(
-                self.location, self.postcode, self.street_number, self.resources
-            )
-        westerwolde = ["westerwolde"]
-        if self.location in westerwolde:
-            self.data = WesterwoldeAfval().get_data(
-                self.location, self.postcode, self.street_number, self.resources
-            )
-        westland = ["westland"]
-        if self.location in westland:
-            self.data = WestlandAfval().get_data(
-                self.location, self.postcode, self.street_number, self.resources
-            )
-        ximmio = ["aalsmeer", "albrandswaard", "almelo", "almere", "barendrecht", "bloemendaal", "borne", "coevorden", "diemen", "ede", "emmen", "enschede", "gorinchem", "haaksbergen", "haarlemmermeer", "hardinxveld-giessendam", "heemstede", "hellendoorn",
-        "hengelo", "hillegom", "hof van twente", "hoogeveen", "lisse", "losser", "meppel", "molenlanden", "nissewaard", "noordwijk", "oldenzaal", "renkum", "renswoude", "ridderkerk", "veenendaal", "vijfheerenlanden", "wageningen", "wierden"]
-        if self.location in ximmio:
-            self.data = XimmioAfval().get_data(
-                self.location, self.postcode, self.street_number, self.resources
-            )
-        zrd = ["hulst", "kapelle", "noord-beveland", "reimerswaal", "sluis", "tholen", "veere"]
-        if self.location in zrd:
-            self.data = ZrdAfval().get_data(
-                self.location, self.postcode, self.street_number, self.resources
-            )
-        zuidwestfriesland = ["zuidwest-friesland"]
-        if self.location in zuidwestfriesland:
-            self.data = ZuidWestFrieslandAfval().get_data(
-                self.location, self.postcode, self.street_number, self.resources
-            )
-
-class AfvalinfoSensor(Entity):
+        resources = list(self.resources)
+        self._requested_resources = set(resources)
+        schedule = await async_get_data(
+            self.breaker, self.provider, self.client, self.location, self.postcode, self.street_number, resources
+        )
+        if isinstance(self.provider, CachedAddressAfval):
+            address = (self.provider.address, self.provider.address_resolved)
+            if address != self._address:
+                self._address = address
+                self._cache.set_address(self._cache_key, *address)
+        # Keep the last good collection dates when the location could not be reached
+        # or isn't called for a while because it kept failing
+        if schedule is False and self.data:
+            return
+        self.data = schedule
+        if schedule:
+            self.fetched = dt_util.utcnow()
+            self._fetched_resources = set(resources)
+            self._cache.set(self._cache_key, resources, schedule, self.fetched)
+
+
+class AfvalinfoSensor(AfvalinfoEntity):
     def __init__(self, data, sensor_type, date_format, timespan_in_days, locale):
         self.data = data
         self.type = sensor_type
         self.date_format = date_format
         self.timespan_in_days = timespan_in_days
         self.locale = locale
+        self.formatter = get_date_formatter(date_format, locale)
         self._name = SENSOR_PREFIX + SENSOR_TYPES[sensor_type][0]
         self._icon = SENSOR_TYPES[sensor_type][1]
         self._hidden = False
@@ -465,56 +390,37 @@ class AfvalinfoSensor(Entity):
 
     @property
     def device_state_attributes(self):
-        return {ATTR_YEAR_MONTH_DAY_DATE: self._year_month_day_date, ATTR_LAST_UPDATE: self._last_update, ATTR_HIDDEN: self._hidden, ATTR_DAYS_UNTIL_COLLECTION_DATE: self._days_until_collection_date, ATTR_IS_COLLECTION_DATE_TODAY: self._is_collection_date_today}
+        return {ATTR_YEAR_MONTH_DAY_DATE: self._year_month_day_date, ATTR_LAST_UPDATE: self._last_update, ATTR_LAST_FETCHED: self.last_fetched, ATTR_HIDDEN: self._hidden, ATTR_DAYS_UNTIL_COLLECTION_DATE: self._days_until_collection_date, ATTR_IS_COLLECTION_DATE_TODAY: self._is_collection_date_today}
 
-    @Throttle(MIN_TIME_BETWEEN_UPDATES)
-    def update(self):
-        self.data.update()
-        waste_data = self.data.data
+    def update_state(self):
+        schedule = self.data.data
+        # The day of the time zone of Home Assistant, which the midnight refresh is in
+        today = dt_util.now().date()
 
         try:
-            if waste_data:
-                if self.type in waste_data:
-                    collection_date = datetime.strptime(
-                        waste_data[self.type], "%Y-%m-%d"
-                    ).date()
+            if schedule:
+                if self.type in schedule:
+                    # The first collection date from today, so a passed collection date
+                    # moves on to the next one without fetching the data again
+                    collection_date = schedule.next_date(self.type, today)
 
                     # Date in date format "%Y-%m-%d"
                     self._year_month_day_date = str(collection_date)
 
                     if collection_date:
                         # Set the values of the sensor
-                        self._last_update = datetime.today().strftime("%d-%m-%Y %H:%M")
 
                         # Is the collection date today?
-                        self._is_collection_date_today = date.today() == collection_date
+                        self._is_collection_date_today = today == collection_date
 
                         # Days until collection date
-                        delta = collection_date - date.today()
+                        delta = collection_date - today
                         self._days_until_collection_date = delta.days
 
                         # Only show the value if the date is lesser than or equal to (today + timespan_in_days)
-                        if collection_date <= date.today() + relativedelta(days=int(self.timespan_in_days)):
-                            #if the date does not contain a named day or month, return the date as normal
-                            if (self.date_format.find('a') == -1 and self.date_format.find('A') == -1
-                            and self.date_format.find('b') == -1 and self.date_format.find('B') == -1):
-                                self._state = collection_date.strftime(self.date_format)
-                            #else convert the named values to the locale names
-                            else:
-                                edited_date_format = self.date_format.replace('%a', 'EEE')
-                                edited_date_format = edited_date_format.replace('%A', 'EEEE')
-                                edited_date_format = edited_date_format.replace('%b', 'MMM')
-                                edited_date_format = edited_date_format.replace('%B', 'MMMM')
-
-                                #half babel, half date string... something like EEEE 04-MMMM-2020
-                                half_babel_half_date = collection_date.strftime(edited_date_format)
-
-                                #replace the digits with qquoted digits 01 --> '01'
-                                half_babel_half_date = re.sub(r"(\d+)", r"'\1'", half_babel_half_date)
-                                #transform the EEE, EEEE etc... to a real locale date, with babel
-                                locale_date = format_date(collection_date, half_babel_half_date, locale=self.locale)
-
-                                self._state = locale_date
+                        if collection_date <= today + relativedelta(days=int(self.timespan_in_days)):
+                            #the named days and months are in the names of the locale
+                            self._state = self.formatter.format(collection_date)
                         else:
                             self._hidden = True
                     else:
@@ -529,4 +435,3 @@ class AfvalinfoSensor(Entity):
             self._days_until_collection_date = None
             self._year_month_day_date = None
             self._is_collection_date_today = False
-            self._last_update = datetime.today().strftime("%d-%m-%Y %H:%M")
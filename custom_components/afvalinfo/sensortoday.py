@@ -1,24 +1,23 @@
 #!/usr/bin/env python3
-from datetime import datetime, date, timedelta
 from .const.const import (
-    _LOGGER,
+    ATTR_LAST_FETCHED,
     ATTR_LAST_UPDATE,
-    ATTR_YEAR_MONTH_DAY_DATE,
     SENSOR_TYPES,
     SENSOR_PREFIX
 )
-from homeassistant.helpers.entity import Entity
-from homeassistant.util import Throttle
+from .entity import AfvalinfoEntity
+import homeassistant.util.dt as dt_util
 
-class AfvalInfoTodaySensor(Entity):
-    def __init__(self, data, sensor_type, entities):
+class AfvalInfoTodaySensor(AfvalinfoEntity):
+    def __init__(self, data, sensor_type, resources):
         self.data = data
         self.type = sensor_type
         self._last_update = None
         self._name = SENSOR_PREFIX + SENSOR_TYPES[sensor_type][0]
         self._state = None
         self._icon = SENSOR_TYPES[sensor_type][1]
-        self._entities = entities
+        # The trash types of the platform with the first word of their sensor name, in the configured order
+        self._resources = [(resource, SENSOR_TYPES[resource][0].split()[0].lower()) for resource in resources]
 
     @property
     def name(self):
@@ -34,24 +33,14 @@ class AfvalInfoTodaySensor(Entity):
 
     @property
     def device_state_attributes(self):
-        return {ATTR_LAST_UPDATE: self._last_update}
+        return {ATTR_LAST_UPDATE: self._last_update, ATTR_LAST_FETCHED: self.last_fetched}
 
-    @Throttle(timedelta(minutes=1))
-    def update(self):
-        self.data.update()
-        self._last_update = datetime.today().strftime("%d-%m-%Y %H:%M")
+    def update_state(self):
+        schedule = self.data.data
+        #the trash types collected today, whatever the order the other sensors were updated in
+        wasteTypes = schedule.waste_types_on(dt_util.now().date()) if schedule else ()
         #use a tempState to change the real state only on a change...
-        tempState = "none"
-        numberOfMatches = 0
-        today = str(date.today().strftime("%Y-%m-%d"))
-        for entity in self._entities:
-            if entity.device_state_attributes.get(ATTR_YEAR_MONTH_DAY_DATE) == today:
-                #reset tempState to empty string
-                if numberOfMatches == 0:
-                    tempState = ""
-                numberOfMatches = numberOfMatches + 1
-                #add trash name to string
-                tempState = (tempState + " " + entity.name.split()[1]).strip().lower()
+        tempState = " ".join(name for resource, name in self._resources if resource in wasteTypes) or "none"
         #only change state if the new state is different than the last state
         if tempState != self._state:
             self._state = tempState
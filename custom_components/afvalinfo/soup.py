@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+import importlib.util
+
+from bs4 import BeautifulSoup
+
+# lxml builds the tree a lot faster than the html parser of the standard library,
+# so use it when it is installed
+HTML_PARSER = "lxml" if importlib.util.find_spec("lxml") is not None else "html.parser"
+
+
+def make_soup(markup, container=None):
+    # container is a SoupStrainer, only the elements it matches (and everything inside them)
+    # are built, the rest of the page is skipped while parsing
+    return BeautifulSoup(markup, HTML_PARSER, parse_only=container)
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Update the number of supported 'gemeenten' in README.md from the location registry
+Usage: python3 scripts/update_readme.py
+"""
+import os
+import re
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from custom_components.afvalinfo.location.registry import supported_gemeenten_count
+
+# Number of 'gemeenten' in The Netherlands
+TOTAL_GEMEENTEN = 352
+
+
+def main():
+    count = supported_gemeenten_count()
+    percentage = "{:.2f}".format(count / TOTAL_GEMEENTEN * 100)
+    line = "### Number of supported 'gemeenten' in The Netherlands: {0} of {1} = {2}%".format(
+        "{:g}".format(count).replace(".", ","), TOTAL_GEMEENTEN, percentage.replace(".", ",")
+    )
+
+    readme = os.path.join(ROOT, "README.md")
+    with open(readme, encoding="utf-8") as f:
+        content = f.read()
+    content = re.sub(r"^### Number of supported 'gemeenten' in The Netherlands:.*$", line, content, count=1, flags=re.M)
+    with open(readme, "w", encoding="utf-8") as f:
+        f.write(content)
+    print(line)
+
+
+if __name__ == "__main__":
+    main()
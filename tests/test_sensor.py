@@ -0,0 +1,75 @@
+"""Tests of AfvalinfoData against the dt_util of the installed Home Assistant."""
+import asyncio
+from datetime import time, timedelta
+
+import pytest
+
+dt_util = pytest.importorskip("homeassistant.util.dt")
+
+from custom_components.afvalinfo.schedule import CollectionSchedule  # noqa: E402
+from custom_components.afvalinfo.sensor import AfvalinfoData  # noqa: E402
+
+TIME_ZONES = ["Europe/Amsterdam", "UTC", "Pacific/Kiritimati", "America/Adak"]
+
+
+@pytest.fixture(params=TIME_ZONES)
+def time_zone(request):
+    default = dt_util.DEFAULT_TIME_ZONE
+    dt_util.set_default_time_zone(dt_util.get_time_zone(request.param))
+    yield request.param
+    dt_util.set_default_time_zone(default)
+
+
+def make_data(waste_dict=None, fetched=None):
+    data = AfvalinfoData(None, None, None, None, object(), None, "sliedrecht", "3361AB", "1")
+    data.resources = list(waste_dict or [])
+    # longer than a day, so only midnight decides the next update of fresh data
+    data._cache_ttl = timedelta(hours=48)
+    if waste_dict is not None:
+        data.data = CollectionSchedule.from_waste_dict(waste_dict)
+        data.fetched = fetched
+        data._fetched_resources = set(waste_dict)
+    return data
+
+
+def next_local_midnight():
+    return dt_util.start_of_local_day(dt_util.now() + timedelta(days=1))
+
+
+def test_next_update_at_local_midnight(time_zone):
+    today = dt_util.now().date()
+    data = make_data({"gft": str(today + timedelta(days=3))}, dt_util.utcnow())
+
+    next_update = dt_util.as_local(data.next_update())
+
+    assert next_update == next_local_midnight()
+    assert next_update.date() == today + timedelta(days=1)
+    assert next_update.time() == time()
+
+
+def test_next_update_retries_when_not_fetched(time_zone):
+    data = make_data()
+    before = dt_util.utcnow()
+
+    next_update = data.next_update()
+
+    assert before < next_update <= dt_util.utcnow() + timedelta(hours=1)
+    assert next_update <= dt_util.as_utc(next_local_midnight())
+
+
+def test_listeners_updated_when_scheduling_fails():
+    data = make_data({"gft": str(dt_util.now().date() + timedelta(days=3))}, dt_util.utcnow())
+    updates = []
+    data._listeners = [lambda: updates.append("gft"), lambda: updates.append("papier")]
+
+    def schedule_refresh():
+        raise RuntimeError("no timer")
+
+    data._async_schedule_refresh = schedule_refresh
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(data._async_refresh())
+    finally:
+        loop.close()
+
+    assert updates == ["gft", "papier"]